@@ -1,16 +1,36 @@
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import BaseMessage, AIMessage, HumanMessage
 from state import State
-from tools.linkedin_scraper import search_linkedin_jobs
-from tools.web_scraper import search_job_boards
+from tools.job_search.dedup import JobDeduplicator
+from tools.job_search.sources import SOURCE_TIMEOUT, JobSource, create_sources, merge_job_streams
+
+# Seconds for the whole search; jobs found by then are kept
+SEARCH_TIMEOUT = 40.0
 
 class JobSearchAgent:
     """Agent responsible for searching jobs based on resume data."""
-    
-    def __init__(self, llm: ChatOpenAI):
+
+    def __init__(
+        self,
+        llm: ChatOpenAI,
+        sources: Optional[List[JobSource]] = None,
+        source_timeout: float = SOURCE_TIMEOUT,
+        search_timeout: float = SEARCH_TIMEOUT
+    ):
+        """
+        Args:
+            llm: Chat model used for search advice
+            sources: Job sources to search (default: every registered source)
+            source_timeout: Seconds each source may take
+            search_timeout: Seconds for the whole search
+        """
         self.llm = llm
+        self.sources = sources if sources is not None else create_sources()
+        self.source_timeout = source_timeout
+        self.search_timeout = search_timeout
         self.prompt = ChatPromptTemplate.from_messages([
             ("system", """You are a job search expert. Your task is to:
             1. Analyze the candidate's resume data
@@ -26,23 +46,64 @@ class JobSearchAgent:
         if "resume_data" not in state:
             raise ValueError("Resume data not found in state")
 
-        # Generate search criteria from resume data
-        search_response = await self.llm.apredict_messages(
+        criteria = self._search_criteria(state)
+
+        # The LLM's search advice doesn't feed the searches, so don't wait for it
+        advice = asyncio.ensure_future(self.llm.apredict_messages(
             self.prompt.format_messages(
                 resume_data=state["resume_data"],
-                search_criteria=state.get("search_criteria", {})
+                search_criteria=criteria
             )
-        )
+        ))
 
-        # Search for jobs using multiple sources
-        linkedin_jobs = await search_linkedin_jobs(search_response.content)
-        web_jobs = await search_job_boards(search_response.content)
+        all_jobs, source_status = await self._search_sources(criteria)
+        search_response = await advice
 
-        # Combine and deduplicate job listings
-        all_jobs = linkedin_jobs + web_jobs
-        
         # Update state with job listings
         state["job_listings"] = all_jobs
+        state["source_status"] = source_status
         state["current_stage"] = "jobs_found"
-        
-        return [search_response], state
\ No newline at end of file
+
+        return [search_response], state
+
+    @staticmethod
+    def _search_criteria(state: State) -> Dict:
+        """Build the sources' criteria dict from the saved preferences and resume."""
+        criteria = dict(state.get("search_query") or state.get("search_criteria") or {})
+        if not criteria.get("keywords"):
+            resume = state.get("resume_data")
+            criteria["keywords"] = list(resume.get("skills", [])) if isinstance(resume, dict) else []
+        for key in ("job_type", "experience_level"):
+            if criteria.get(key) == "Any":
+                criteria.pop(key)
+        return criteria
+
+    async def _search_sources(self, criteria: Dict) -> Tuple[List[Dict], Dict[str, str]]:
+        """
+        Query every source concurrently and merge their results.
+
+        Each source is cut off after `source_timeout` seconds and the whole
+        search after `search_timeout`; jobs that arrived before a cut-off are
+        kept. Duplicates across sources are dropped as the jobs arrive.
+
+        Returns:
+            The deduplicated jobs in arrival order, and each source's status:
+            "ok", "timeout" or "error"
+        """
+        dedup = JobDeduplicator()
+        jobs: List[Dict] = []
+        status: Dict[str, str] = {}
+
+        async def collect():
+            stream = merge_job_streams(self.sources, criteria, self.source_timeout, status)
+            async for job in dedup.filter_stream(stream):
+                jobs.append(job)
+
+        try:
+            await asyncio.wait_for(collect(), self.search_timeout)
+        except asyncio.TimeoutError:
+            print(f"Job search timed out after {self.search_timeout:g}s; keeping {len(jobs)} jobs")
+
+        if dedup.duplicates:
+            print(f"Dropped {dedup.duplicates} duplicate job listings")
+        return jobs, status
@@ -0,0 +1,364 @@
+"""Parsing of LLM replies into typed state records.
+
+Models are asked for JSON, but replies still arrive wrapped in code fences,
+with leading prose, trailing commas or Python literals. `extract_json`
+tries a plain `json.loads` first (the fast path) and only then repairs the
+text: it cuts out the outermost JSON object or array and fixes the common
+syntax slips before parsing again.
+
+Score values are normalized to floats in [0, 1]: percentages ("85%", 85)
+and "x/10" or "x out of 5" ratings are converted, and out-of-range values
+clamped.
+Parsed resumes are coerced into the `ResumeData` shape, with missing
+sections filled in as empty values.
+"""
+from typing import Any, Dict, List, Optional
+import json
+import re
+
+from state import Education, JobScore, PersonalInfo, Project, ResumeData, WorkExperience
+
+_SCORE_FIELDS = ("skill_score", "experience_score", "qualitative_score")
+
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_PYTHON_LITERAL_RE = re.compile(r"\b(True|False|None)\b")
+_SMART_QUOTES = str.maketrans({"“": '"', "”": '"', "‘": "'", "’": "'"})
+_RATIO_RE = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*(?:/|out\s+of)\s*(\d+(?:\.\d+)?)\s*$", re.I)
+_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+# A number, optionally followed by its scale ("80%", "8/10", "4 out of 5")
+_PROSE_NUMBER = r"\d+(?:\.\d+)?"
+_PROSE_SCALE = r"(?:\s*%|\s*/\s*\d+(?:\.\d+)?|\s+out\s+of\s+\d+(?:\.\d+)?)"
+
+
+def _prose_field(label: str) -> "re.Pattern":
+    """
+    Pattern for a "Skill score: 80%"-style field in a prose reply.
+
+    The number must come right after a score word (score, match, fit,
+    rating) or carry its scale, so "Experience: 5 years" is not read as a
+    score.
+    """
+    return re.compile(
+        rf"\b(?:{label})\W{{0,3}}(?:"
+        rf"[\w ]{{0,24}}?\W{{0,3}}\b(?:score|match|fit|rating)\b\W{{0,3}}({_PROSE_NUMBER}{_PROSE_SCALE}?)"
+        rf"|({_PROSE_NUMBER}{_PROSE_SCALE}))",
+        re.I,
+    )
+
+
+_PROSE_FIELD_RES = {
+    "total_score": _prose_field(r"total|overall"),
+    "skill_score": _prose_field(r"skills?"),
+    "experience_score": _prose_field(r"experience"),
+    "qualitative_score": _prose_field(r"qualitative|cultur\w*"),
+}
+
+
+def extract_json(text: str) -> Any:
+    """
+    Parse the JSON value in an LLM reply.
+
+    Raises:
+        ValueError: If no JSON value can be recovered from the text
+    """
+    text = (text or "").strip()
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+
+    fenced = _CODE_FENCE_RE.search(text)
+    if fenced:
+        text = fenced.group(1).strip()
+
+    candidate = _outermost_json(text.translate(_SMART_QUOTES))
+    if candidate is None:
+        raise ValueError("No JSON object found in reply")
+    for attempt in (candidate, _repair(candidate)):
+        try:
+            return json.loads(attempt)
+        except ValueError:
+            continue
+    raise ValueError("Reply contains malformed JSON")
+
+
+def _outermost_json(text: str) -> Optional[str]:
+    """The first balanced {...} or [...] span in `text`, ignoring brackets in strings."""
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    if not starts:
+        return None
+    start = min(starts)
+    depth = 0
+    quote = None
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if quote:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    # Unbalanced, e.g. a truncated reply
+    return None
+
+
+def _repair(text: str) -> str:
+    """Fix trailing commas, Python literals and single-quoted strings."""
+    text = _TRAILING_COMMA_RE.sub(r"\1", text)
+    text = _PYTHON_LITERAL_RE.sub(lambda m: _PYTHON_LITERALS[m.group(1)], text)
+    if '"' not in text:
+        text = text.replace("'", '"')
+    return text
+
+
+def to_score(value: Any) -> Optional[float]:
+    """
+    Convert a score given as a fraction, percentage or rating to [0, 1].
+
+    Bare numbers above 1 are read as percentages above 10 and as 0-10
+    ratings from 2 to 10; a number between 1 and 2 is taken as a 0-1 score
+    that overshot and is clamped.
+
+    Returns:
+        The score, or None if the value is not a number
+    """
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        number = float(value)
+    else:
+        text = str(value).strip()
+        ratio = _RATIO_RE.match(text)
+        if ratio and float(ratio.group(2)):
+            number = float(ratio.group(1)) / float(ratio.group(2))
+        else:
+            match = _NUMBER_RE.search(text)
+            if not match:
+                return None
+            number = float(match.group())
+            if "%" in text:
+                number /= 100
+    if number > 10:
+        number /= 100
+    elif number >= 2:
+        number /= 10
+    return min(1.0, max(0.0, number))
+
+
+def parse_job_score(data: Dict, defaults: Optional[JobScore] = None) -> JobScore:
+    """
+    Build a validated `JobScore` from a parsed score entry.
+
+    Args:
+        data: Score fields from the LLM (missing or invalid ones are allowed)
+        defaults: Scores used for fields the LLM did not provide (the
+            total is used for fields missing from both)
+
+    Raises:
+        ValueError: If the entry gives no score at all
+    """
+    defaults = defaults or {}
+    given = {field: to_score(data.get(field)) for field in _SCORE_FIELDS}
+    total = to_score(data.get("total_score", data.get("match_percentage")))
+    known = [value for value in given.values() if value is not None]
+    if total is None and not known:
+        raise ValueError("Reply contains no scores")
+    if total is None:
+        total = sum(known) / len(known)
+
+    fields = {
+        field: value if value is not None else defaults.get(field)
+        for field, value in given.items()
+    }
+
+    return JobScore(
+        total_score=round(total, 4),
+        skill_score=round(fields["skill_score"] if fields["skill_score"] is not None else total, 4),
+        experience_score=round(fields["experience_score"] if fields["experience_score"] is not None else total, 4),
+        qualitative_score=round(fields["qualitative_score"] if fields["qualitative_score"] is not None else total, 4),
+        explanation=str(data.get("explanation") or ""),
+    )
+
+
+def parse_score_reply(content: str, defaults: Optional[JobScore] = None) -> JobScore:
+    """
+    Parse a single-job scoring reply.
+
+    JSON replies (an object, a list of objects or {"scores": [...]}) are
+    parsed directly; prose replies fall back to reading "Skill score: 80%"-style
+    fields.
+
+    Raises:
+        ValueError: If no score can be found in the reply
+    """
+    try:
+        data = extract_json(content)
+    except ValueError:
+        data = None
+    if isinstance(data, dict) and isinstance(data.get("scores"), list) and data["scores"]:
+        data = data["scores"]
+    if isinstance(data, list):
+        if not data:
+            raise ValueError("Reply holds an empty list of scores")
+        data = data[0]
+        if not isinstance(data, dict):
+            raise ValueError(f"Score entry is not an object: {data!r}")
+    if isinstance(data, dict):
+        return parse_job_score(data, defaults)
+
+    prose = {}
+    for field, pattern in _PROSE_FIELD_RES.items():
+        match = pattern.search(content or "")
+        if match:
+            prose[field] = match.group(1) or match.group(2)
+    prose["explanation"] = (content or "").strip()
+    return parse_job_score(prose, defaults)
+
+
+def parse_batch_reply(content: str, defaults: Optional[Dict[str, JobScore]] = None) -> Dict[str, JobScore]:
+    """
+    Parse a batched scoring reply into scores keyed by job id.
+
+    Entries that cannot be validated are left out, so the caller can score
+    those jobs again on their own.
+
+    Raises:
+        ValueError: If the reply is not a list of score entries
+    """
+    defaults = defaults or {}
+    data = extract_json(content)
+    entries = data.get("scores") if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        raise ValueError("Batched reply has no list of scores")
+
+    scores = {}
+    for entry in entries:
+        if not isinstance(entry, dict) or entry.get("job_id") is None:
+            continue
+        job_id = str(entry["job_id"])
+        try:
+            scores[job_id] = parse_job_score(entry, defaults.get(job_id))
+        except ValueError:
+            continue
+    return scores
+
+
+def _text(value: Any) -> str:
+    return " ".join(str(value).split()) if value is not None else ""
+
+
+def _optional_text(value: Any) -> Optional[str]:
+    return _text(value) or None
+
+
+def _texts(value: Any, separators: str = r"[\n,;]") -> List[str]:
+    """A list of non-empty strings from a list, or a string split on `separators`."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = re.split(separators, value)
+    elif not isinstance(value, (list, tuple)):
+        value = [value]
+    items = []
+    for item in value:
+        if isinstance(item, dict):
+            item = item.get("name") or item.get("skill") or item.get("description") or ""
+        if _text(item):
+            items.append(_text(item))
+    return items
+
+
+def _records(value: Any, section: str) -> List[Dict]:
+    """The entries of a resume section given as a list of objects (or a single object)."""
+    if value is None:
+        return []
+    if isinstance(value, dict):
+        return [value]
+    if not isinstance(value, (list, tuple)):
+        raise ValueError(f"Resume section {section!r} is not a list")
+    return [item for item in value if isinstance(item, dict)]
+
+
+def _gpa(value: Any) -> Optional[float]:
+    match = _NUMBER_RE.search(str(value)) if value is not None else None
+    return float(match.group()) if match else None
+
+
+def parse_resume_data(data: Any) -> ResumeData:
+    """
+    Build a validated `ResumeData` from a parsed resume reply.
+
+    Section and field names follow `state.ResumeData`; a few common
+    variants (e.g. "work_experience", "title" for "position") are accepted.
+
+    Raises:
+        ValueError: If the reply is not a JSON object with any resume section,
+            or a section holds something other than a list of entries
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Resume reply is not a JSON object")
+    sections = ("personal_info", "education", "experience", "work_experience", "skills", "projects")
+    if not any(key in data for key in sections):
+        raise ValueError("Resume reply has none of the ResumeData sections")
+
+    info = data.get("personal_info") if isinstance(data.get("personal_info"), dict) else {}
+    if isinstance(data.get("skills"), dict):
+        # {"technical": [...], "soft": [...]}
+        skills = [skill for group in data["skills"].values() for skill in _texts(group)]
+    else:
+        skills = _texts(data.get("skills"))
+
+    return ResumeData(
+        personal_info=PersonalInfo(
+            name=_text(info.get("name")),
+            email=_text(info.get("email")),
+            phone=_optional_text(info.get("phone")),
+            location=_optional_text(info.get("location")),
+            linkedin=_optional_text(info.get("linkedin")),
+        ),
+        education=[
+            Education(
+                degree=_text(item.get("degree")),
+                institution=_text(item.get("institution") or item.get("school")),
+                start_date=_text(item.get("start_date")),
+                end_date=_optional_text(item.get("end_date")),
+                gpa=_gpa(item.get("gpa")),
+                achievements=_texts(item.get("achievements"), r"\n"),
+            )
+            for item in _records(data.get("education"), "education")
+        ],
+        experience=[
+            WorkExperience(
+                company=_text(item.get("company")),
+                position=_text(item.get("position") or item.get("title")),
+                start_date=_text(item.get("start_date")),
+                end_date=_optional_text(item.get("end_date")),
+                description=_texts(item.get("description"), r"\n"),
+                achievements=_texts(item.get("achievements"), r"\n"),
+            )
+            for item in _records(data.get("experience") or data.get("work_experience"), "experience")
+        ],
+        skills=list(dict.fromkeys(skills)),
+        projects=[
+            Project(
+                name=_text(item.get("name")),
+                description=_text(item.get("description")),
+                technologies=_texts(item.get("technologies")),
+                url=_optional_text(item.get("url")),
+            )
+            for item in _records(data.get("projects"), "projects")
+        ],
+    )
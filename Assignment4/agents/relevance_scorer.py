@@ -1,49 +1,299 @@
-from typing import Any, Dict, List, Tuple
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
+import asyncio
+import json
+import sqlite3
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import BaseMessage, AIMessage, HumanMessage
-from state import State
+from state import JobScore, State
+from agents.output_parsing import parse_batch_reply, parse_score_reply
+from tools.job_search.descriptions import hydrate_descriptions
+from tools.job_search.prescoring import prescore_jobs, top_candidates, with_qualitative
+from tools.job_search.score_cache import ScoreCache, get_score_cache
+
+# Maximum number of scoring requests in flight at once
+SCORING_CONCURRENCY = 5
+
+# Seconds allowed for scoring one job
+SCORING_TIMEOUT = 60.0
+
+# Number of best pre-scored jobs sent to the LLM
+LLM_TOP_K = 15
+
+# Prompt tokens allowed per batched scoring request
+BATCH_TOKEN_BUDGET = 6000
+
+# Maximum number of jobs scored in one request
+MAX_BATCH_SIZE = 8
+
+# Bump when the scoring prompts change so cached scores are not reused
+SCORING_PROMPT_VERSION = "3"
+
+# Tokens reserved for each job's entry in a batched reply
+_REPLY_TOKENS_PER_JOB = 150
+
+_BATCH_INSTRUCTIONS = """You are an expert at matching job requirements with candidate qualifications.
+            Skill and experience-level matches are computed separately. For each job
+            below, judge what they miss from the job description and the candidate's resume:
+            1. How closely the responsibilities and domain fit the candidate's background
+            2. Cultural fit indicators
+            3. Location and other preferences
+            Reply with JSON only, in this form, with one entry per job and a qualitative score between 0 and 1:
+            {{"scores": [{{"job_id": "...", "qualitative_score": 0.0, "explanation": "..."}}]}}"""
+
+
+class ScoreUpdate(NamedTuple):
+    """A job's score as reported by `RelevanceScorerAgent.stream_scores`."""
+    job_id: str
+    score: JobScore
+    provisional: bool
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token for English text)."""
+    return len(text) // 4 + 1
+
 
 class RelevanceScorerAgent:
     """Agent responsible for scoring job matches against resume."""
-    
-    def __init__(self, llm: ChatOpenAI):
+
+    def __init__(
+        self,
+        llm: ChatOpenAI,
+        concurrency: int = SCORING_CONCURRENCY,
+        timeout: float = SCORING_TIMEOUT,
+        top_k: int = LLM_TOP_K,
+        batched: bool = True,
+        batch_token_budget: int = BATCH_TOKEN_BUDGET,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        score_cache: Optional[ScoreCache] = None,
+        use_cache: bool = True
+    ):
+        """
+        Args:
+            llm: Chat model used for scoring
+            concurrency: Maximum number of scoring requests at once
+            timeout: Seconds allowed per job before it is recorded as failed
+            top_k: Number of best pre-scored jobs sent to the LLM
+            batched: Score several jobs per request
+            batch_token_budget: Prompt tokens allowed per batched request
+            max_batch_size: Maximum number of jobs per batched request
+            score_cache: Cache of earlier scores (default: the shared on-disk cache)
+            use_cache: Reuse and store scores across runs
+        """
         self.llm = llm
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.top_k = top_k
+        self.batched = batched
+        self.batch_token_budget = batch_token_budget
+        self.max_batch_size = max_batch_size
+        self.score_cache = None
+        if use_cache:
+            try:
+                self.score_cache = score_cache if score_cache is not None else get_score_cache()
+            except (sqlite3.Error, OSError) as e:
+                # An unwritable or locked cache shouldn't stop scoring
+                print(f"Score cache unavailable ({e}); scoring without it")
         self.prompt = ChatPromptTemplate.from_messages([
             ("system", """You are an expert at matching job requirements with candidate qualifications.
-            Analyze the job description and resume to:
-            1. Compare required skills vs candidate skills
-            2. Evaluate experience level match
-            3. Assess cultural fit indicators
-            4. Consider location and other preferences
-            Score each aspect and provide an overall match percentage and detailed explanation."""),
+            Skill and experience-level matches are computed separately. Analyze the job
+            description and resume to judge what they miss:
+            1. How closely the responsibilities and domain fit the candidate's background
+            2. Cultural fit indicators
+            3. Location and other preferences
+            Give a qualitative score and a detailed explanation.
+            Reply with JSON only, in this form, with a score between 0 and 1:
+            {{"qualitative_score": 0.0, "explanation": "..."}}"""),
             ("user", "Job Description: {job_description}\nResume Data: {resume_data}")
         ])
+        self.batch_prompt = ChatPromptTemplate.from_messages([
+            ("system", _BATCH_INSTRUCTIONS),
+            ("user", "Resume Data: {resume_data}\n\nJobs:\n{jobs}")
+        ])
 
     async def process(self, state: State) -> Tuple[List[BaseMessage], State]:
         """Score jobs for relevance against resume."""
+        llm_scores = {
+            update.job_id: update.score
+            async for update in self.stream_scores(state)
+            if not update.provisional
+        }
+        return [AIMessage(content=json.dumps(llm_scores))], state
+
+    async def stream_scores(self, state: State) -> AsyncIterator[ScoreUpdate]:
+        """
+        Score jobs for relevance, yielding each score as soon as it is known.
+
+        Provisional scores for every job come first, then cached scores, then
+        LLM scores as each request completes. `state` is updated as the scores
+        arrive, and completed when the iterator is exhausted; closing it early
+        cancels the outstanding requests.
+
+        Yields:
+            Score updates; a job's LLM score replaces its provisional one
+            (keeping the local skill and experience scores)
+        """
         if "job_listings" not in state or "resume_data" not in state:
             raise ValueError("Missing job listings or resume data in state")
 
-        scores = {}
         explanations = {}
-        
-        # Score each job
-        for job in state["job_listings"]:
-            score_response = await self.llm.apredict_messages(
+        errors = {}
+        state["score_errors"] = errors
+
+        # Rank every job locally first; only the best candidates go to the LLM
+        location = (state.get("search_query") or {}).get("location")
+        provisional = prescore_jobs(state["job_listings"], state["resume_data"], location)
+        state["relevance_scores"] = provisional
+        for job_id, provisional_score in list(provisional.items()):
+            yield ScoreUpdate(job_id, provisional_score, True)
+        candidates = top_candidates(state["job_listings"], provisional, self.top_k)
+        resume_data = state["resume_data"]
+
+        # Reuse scores from earlier runs for the same resume, jobs and prompt
+        version = self._scoring_version()
+        cached = self._cached_scores(resume_data, candidates, version)
+        for job_id, cached_score in cached.items():
+            provisional[job_id] = cached_score
+            explanations[job_id] = cached_score["explanation"]
+            yield ScoreUpdate(job_id, cached_score, False)
+        jobs = [job for job in candidates if job["id"] not in cached]
+        if cached:
+            print(f"Reused {len(cached)} cached job scores")
+
+        # Scraped listings only carry a summary; fetch the full descriptions now
+        await hydrate_descriptions(jobs)
+
+        # Score the jobs concurrently, a bounded number of requests at a time
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def call(messages, jobs_in_request: int):
+            async with semaphore:
+                return await asyncio.wait_for(
+                    self.llm.apredict_messages(messages),
+                    self.timeout * jobs_in_request
+                )
+
+        async def score(job: Dict) -> JobScore:
+            response = await call(
                 self.prompt.format_messages(
                     job_description=job["description"],
-                    resume_data=state["resume_data"]
-                )
+                    resume_data=resume_data
+                ),
+                1
             )
-            
-            # Parse the scoring response
-            scores[job["id"]] = score_response.content
-            explanations[job["id"]] = score_response.content
-
-        # Update state with scores
-        state["job_scores"] = scores
-        state["score_explanations"] = explanations
+            return parse_score_reply(response.content)
+
+        async def score_batch(batch: List[Dict]) -> List[Tuple[Dict, Any]]:
+            if len(batch) == 1:
+                try:
+                    return [(batch[0], await score(batch[0]))]
+                except Exception as e:
+                    return [(batch[0], e)]
+            try:
+                response = await call(
+                    self.batch_prompt.format_messages(
+                        resume_data=resume_data,
+                        jobs=self._format_jobs(batch)
+                    ),
+                    len(batch)
+                )
+                parsed = parse_batch_reply(response.content)
+            except Exception as e:
+                print(f"Batched scoring of {len(batch)} jobs failed ({e!r}); scoring them one by one")
+                parsed = {}
+
+            # Jobs the batched reply left out are scored on their own
+            missing = [job for job in batch if job["id"] not in parsed]
+            fallback = await asyncio.gather(*(score(job) for job in missing), return_exceptions=True)
+            singles = dict(zip((job["id"] for job in missing), fallback))
+            return [(job, parsed[job["id"]] if job["id"] in parsed else singles[job["id"]]) for job in batch]
+
+        batches = self._plan_batches(jobs, resume_data) if self.batched else [[job] for job in jobs]
+        tasks = [asyncio.ensure_future(score_batch(batch)) for batch in batches]
+        new_scores = {}
+        try:
+            # A failed job doesn't abort the others
+            for finished in asyncio.as_completed(tasks):
+                for job, score_response in await finished:
+                    if isinstance(score_response, Exception):
+                        print(f"Error scoring job {job['id']}: {score_response!r}")
+                        errors[job["id"]] = repr(score_response)
+                        continue
+
+                    # Local skill and experience scores stay; the LLM's
+                    # assessment replaces the text similarity
+                    score_response = with_qualitative(
+                        provisional[job["id"]],
+                        score_response["qualitative_score"],
+                        score_response["explanation"]
+                    )
+                    provisional[job["id"]] = score_response
+                    new_scores[job["id"]] = score_response
+                    yield ScoreUpdate(job["id"], score_response, False)
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._store_scores(resume_data, jobs, new_scores, version)
+
+        # Update state with scores, explanations in ranking order
+        for job in jobs:
+            if job["id"] in new_scores:
+                explanations[job["id"]] = new_scores[job["id"]]["explanation"]
+        state["score_explanations"] = {
+            job["id"]: explanations[job["id"]] for job in candidates if job["id"] in explanations
+        }
         state["current_stage"] = "jobs_scored"
-        
-        return [BaseMessage(content=str(scores))], state
\ No newline at end of file
+
+    def _scoring_version(self) -> str:
+        """Model and prompt version the scores were produced with."""
+        model = getattr(self.llm, "model_name", None) or getattr(self.llm, "model", None) or type(self.llm).__name__
+        return f"{model}:{SCORING_PROMPT_VERSION}"
+
+    def _cached_scores(self, resume_data, jobs: List[Dict], version: str) -> Dict[str, JobScore]:
+        if self.score_cache is None:
+            return {}
+        try:
+            return self.score_cache.lookup(resume_data, jobs, version)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"Error reading score cache: {e}")
+            return {}
+
+    def _store_scores(self, resume_data, jobs: List[Dict], scores: Dict[str, JobScore], version: str) -> None:
+        if self.score_cache is None or not scores:
+            return
+        try:
+            self.score_cache.store_scores(resume_data, jobs, scores, version)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"Error writing score cache: {e}")
+
+    def _plan_batches(self, jobs: List[Dict], resume_data) -> List[List[Dict]]:
+        """
+        Group jobs into requests that fit the prompt token budget.
+
+        The resume and instructions are paid once per request, so each batch
+        takes as many jobs as fit next to them. A job too large to share a
+        request gets one of its own.
+        """
+        fixed = estimate_tokens(str(resume_data)) + estimate_tokens(_BATCH_INSTRUCTIONS)
+        batches: List[List[Dict]] = []
+        batch: List[Dict] = []
+        used = fixed
+        for job in jobs:
+            cost = estimate_tokens(self._format_jobs([job])) + _REPLY_TOKENS_PER_JOB
+            if batch and (used + cost > self.batch_token_budget or len(batch) >= self.max_batch_size):
+                batches.append(batch)
+                batch, used = [], fixed
+            batch.append(job)
+            used += cost
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _format_jobs(jobs: List[Dict]) -> str:
+        return "\n\n".join(
+            f"Job ID: {job['id']}\nTitle: {job.get('title', '')}\nCompany: {job.get('company', '')}\n"
+            f"Location: {job.get('location', '')}\nDescription: {job.get('description', '')}"
+            for job in jobs
+        )
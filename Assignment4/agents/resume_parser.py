@@ -1,15 +1,82 @@
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+import os
+import sqlite3
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import BaseMessage, AIMessage, HumanMessage
 
-from state import State
+from state import ResumeData, State
+from agents.output_parsing import extract_json, parse_resume_data
+from tools.config import env_number
+from tools.sqlite_store import SQLiteStore, default_cache_path
+
+# Bump when the parsing prompt changes so cached resumes are parsed again
+PARSER_PROMPT_VERSION = "2"
+
+# Parsed resumes kept in memory
+MEMORY_CACHE_SIZE = 32
+
+_RESUME_SCHEMA = """{{
+  "personal_info": {{"name": "", "email": "", "phone": null, "location": null, "linkedin": null}},
+  "education": [{{"degree": "", "institution": "", "start_date": "", "end_date": null, "gpa": null, "achievements": []}}],
+  "experience": [{{"company": "", "position": "", "start_date": "", "end_date": null, "description": [], "achievements": []}}],
+  "skills": [],
+  "projects": [{{"name": "", "description": "", "technologies": [], "url": null}}]
+}}"""
+
+
+def normalize_resume_text(text: str) -> str:
+    """Collapse whitespace so re-pasted or re-exported copies of a resume match."""
+    return "\n".join(" ".join(line.split()) for line in text.strip().splitlines() if line.strip())
+
+
+_memory_cache: "OrderedDict[str, ResumeData]" = OrderedDict()
+_store: Optional[SQLiteStore] = None
+
+
+def get_resume_store() -> SQLiteStore:
+    """Return the on-disk store of parsed resumes configured from the environment.
+
+    Settings come from environment variables (or `.env`):
+
+        JOBCONNECT_RESUME_CACHE_PATH  SQLite file (default ~/.cache/jobconnect/cache.sqlite3)
+        JOBCONNECT_RESUME_CACHE_TTL   seconds a parsed resume is kept (default 30 days)
+    """
+    global _store
+    if _store is None:
+        _store = SQLiteStore(
+            os.getenv("JOBCONNECT_RESUME_CACHE_PATH") or default_cache_path("cache.sqlite3"),
+            table="parsed_resumes",
+            ttl=env_number("JOBCONNECT_RESUME_CACHE_TTL", 30 * 24 * 3600),
+            max_entries=1000,
+        )
+    return _store
+
 
 class ResumeParserAgent:
     """Agent responsible for parsing resume content and extracting structured data."""
-    
-    def __init__(self, llm: ChatOpenAI):
+
+    def __init__(self, llm: ChatOpenAI, store: Optional[SQLiteStore] = None, use_cache: bool = True):
+        """
+        Args:
+            llm: Chat model used for parsing
+            store: On-disk store of parsed resumes (default: the shared cache file)
+            use_cache: Reuse parsed resumes from memory and disk
+        """
         self.llm = llm
+        self.store = None
+        self.use_cache = use_cache
+        if use_cache:
+            try:
+                self.store = store if store is not None else get_resume_store()
+            except (sqlite3.Error, OSError) as e:
+                # An unwritable or locked cache shouldn't stop parsing
+                print(f"Resume cache unavailable ({e}); parsing without it")
+                self.use_cache = False
         self.prompt = ChatPromptTemplate.from_messages([
             ("system", """You are an expert resume parser. Your task is to extract key information from resumes into a structured format.
             Extract the following information:
@@ -18,7 +85,8 @@ class ResumeParserAgent:
             - Work Experience (companies, positions, dates, key achievements)
             - Skills (technical skills, soft skills)
             - Projects (names, descriptions, technologies used)
-            Format the output as a detailed JSON structure."""),
+            Reply with JSON only, using exactly this structure (null for unknown values):
+            """ + _RESUME_SCHEMA),
             ("user", "{resume_text}")
         ])
 
@@ -27,13 +95,85 @@ class ResumeParserAgent:
         if "resume_text" not in state:
             raise ValueError("Resume text not found in state")
 
-        # Generate structured resume data
-        parsed_data = await self.llm.apredict_messages(
-            self.prompt.format_messages(resume_text=state["resume_text"])
-        )
+        resume_text = normalize_resume_text(state["resume_text"])
+        key = self._cache_key(resume_text)
+
+        # The same resume parses to the same data; skip the LLM when we have it
+        resume_data = self._cached(key)
+        if resume_data is not None:
+            messages: List[BaseMessage] = [AIMessage(content=json.dumps(resume_data))]
+        else:
+            # Generate structured resume data
+            parsed_data = await self.llm.apredict_messages(
+                self.prompt.format_messages(resume_text=resume_text)
+            )
+            messages = [parsed_data]
+            try:
+                resume_data = parse_resume_data(extract_json(parsed_data.content))
+            except ValueError as e:
+                # One retry, telling the model what went wrong
+                print(f"Resume reply was not valid ResumeData ({e}); asking again")
+                retry = await self.llm.apredict_messages(
+                    self.prompt.format_messages(resume_text=resume_text) + [
+                        AIMessage(content=parsed_data.content),
+                        HumanMessage(content=f"That reply could not be used: {e}. Reply with the JSON object only."),
+                    ]
+                )
+                messages.append(retry)
+                resume_data = parse_resume_data(extract_json(retry.content))
+            self._remember(key, resume_data)
 
         # Update state with parsed resume data
-        state["resume_data"] = parsed_data.content
+        state["resume_data"] = resume_data
         state["current_stage"] = "resume_parsed"
-        
-        return [parsed_data], state
\ No newline at end of file
+
+        return messages, state
+
+    def _cache_key(self, resume_text: str) -> str:
+        """Hash of the normalized resume text, model and prompt version."""
+        model = getattr(self.llm, "model_name", None) or getattr(self.llm, "model", None) or type(self.llm).__name__
+        content = f"{model}:{PARSER_PROMPT_VERSION}\n{resume_text}"
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _cached(self, key: str) -> Optional[ResumeData]:
+        if not self.use_cache:
+            return None
+        if key in _memory_cache:
+            _memory_cache.move_to_end(key)
+            # Copy so changes made to the state don't leak into the cache
+            return copy.deepcopy(_memory_cache[key])
+        try:
+            stored = self.store.get(key)
+        except sqlite3.Error as e:
+            print(f"Error reading resume cache: {e}")
+            return None
+        if stored is None:
+            return None
+        try:
+            resume_data = parse_resume_data(stored)
+        except ValueError as e:
+            # Corrupt or written in an older format; parse the resume again
+            print(f"Discarding unusable cached resume: {e}")
+            try:
+                self.store.delete(key)
+            except sqlite3.Error as e:
+                print(f"Error writing resume cache: {e}")
+            return None
+        self._remember_in_memory(key, resume_data)
+        return resume_data
+
+    def _remember(self, key: str, resume_data: ResumeData) -> None:
+        if not self.use_cache:
+            return
+        self._remember_in_memory(key, resume_data)
+        try:
+            self.store.set(key, resume_data)
+        except sqlite3.Error as e:
+            print(f"Error writing resume cache: {e}")
+
+    @staticmethod
+    def _remember_in_memory(key: str, resume_data: ResumeData) -> None:
+        _memory_cache[key] = copy.deepcopy(resume_data)
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
@@ -0,0 +1,148 @@
+"""Benchmark for the job board result-page parsers.
+
+Compares the previous BeautifulSoup `html.parser` extraction ("before") with
+the lxml XPath extractors in `tools.web_scraper` ("after") and reports
+pages/sec for each board.
+
+Saved result pages can be used as fixtures by putting them in a folder as
+`indeed_*.html` / `glassdoor_*.html`; otherwise synthetic pages with the
+same card markup are generated (and written there with `--write-fixtures`).
+
+Run from the `Assignment4/` folder:
+
+    python -m benchmarks.bench_html_parsing --fixtures benchmarks/fixtures
+"""
+from typing import Callable, Dict, List
+import argparse
+import glob
+import os
+import random
+import time
+
+from bs4 import BeautifulSoup
+
+from tools.web_scraper import extract_glassdoor_jobs, extract_indeed_jobs
+
+# Padding that real result pages carry around the job cards
+_PAGE_NOISE = "<div class='nav'>" + "<a href='#'>link</a>" * 200 + "</div>"
+
+
+def _indeed_card(rng: random.Random, i: int) -> str:
+    return (
+        f'<div class="cardOutline job_seen_beacon" data-jk="jk{i:06d}">'
+        f'<h2 class="jobTitle css-1"><a><span>Software Engineer {rng.randint(1, 999)}</span></a></h2>'
+        f'<span class="companyName">Company {rng.randint(1, 50)}</span>'
+        f'<div class="companyLocation">Singapore</div>'
+        f'<div class="job-snippet"><ul><li>{"Build scalable systems. " * rng.randint(3, 10)}</li></ul></div>'
+        f'</div>'
+    )
+
+
+def _glassdoor_card(rng: random.Random, i: int) -> str:
+    return (
+        f'<li class="react-job-listing css-2" data-id="{i:08d}">'
+        f'<a class="jobLink" href="/job/{i}">Data Scientist {rng.randint(1, 999)}</a>'
+        f'<div class="jobHeader">Company {rng.randint(1, 50)}</div>'
+        f'<span class="loc">Remote</span>'
+        f'<div class="jobDescriptionContent">{"Analyse data and ship models. " * rng.randint(3, 10)}</div>'
+        f'</li>'
+    )
+
+
+def _synthetic_page(card: Callable[[random.Random, int], str], rng: random.Random, cards: int) -> str:
+    body = "".join(card(rng, i) for i in range(cards))
+    return f"<html><head><title>jobs</title></head><body>{_PAGE_NOISE}{body}{_PAGE_NOISE}</body></html>"
+
+
+def _bs4_indeed(html: str) -> List[Dict]:
+    """Previous BeautifulSoup-based Indeed extraction."""
+    soup = BeautifulSoup(html, 'html.parser')
+    jobs = []
+    for card in soup.find_all("div", class_="job_seen_beacon"):
+        jobs.append({
+            "id": card.get("data-jk", ""),
+            "title": card.find("h2", class_="jobTitle").text.strip(),
+            "company": card.find("span", class_="companyName").text.strip(),
+            "location": card.find("div", class_="companyLocation").text.strip(),
+            "description": card.find("div", class_="job-snippet").text.strip(),
+            "source": "Indeed"
+        })
+    return jobs
+
+
+def _bs4_glassdoor(html: str) -> List[Dict]:
+    """Previous BeautifulSoup-based Glassdoor extraction."""
+    soup = BeautifulSoup(html, 'html.parser')
+    jobs = []
+    for card in soup.find_all("li", class_="react-job-listing"):
+        jobs.append({
+            "id": card.get("data-id", ""),
+            "title": card.find("a", class_="jobLink").text.strip(),
+            "company": card.find("div", class_="jobHeader").text.strip(),
+            "location": card.find("span", class_="loc").text.strip(),
+            "description": card.find("div", class_="jobDescriptionContent").text.strip(),
+            "source": "Glassdoor"
+        })
+    return jobs
+
+
+def _comparable(job: Dict) -> tuple:
+    """Fields both extractors produce (the old one called the snippet `description`)."""
+    return (job["id"], job["title"], job["company"], job["location"], job.get("summary") or job.get("description"))
+
+
+def _load_pages(folder: str, board: str) -> List[str]:
+    pages = []
+    for path in sorted(glob.glob(os.path.join(folder, f"{board}_*.html"))):
+        with open(path, encoding="utf-8") as f:
+            pages.append(f.read())
+    return pages
+
+
+def _pages_per_second(parser: Callable[[str], List[Dict]], pages: List[str], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for page in pages:
+            parser(page)
+    return rounds * len(pages) / (time.perf_counter() - start)
+
+
+def main():
+    """Parse arguments, prepare fixtures and print the comparison."""
+    parser = argparse.ArgumentParser(description="Benchmark job board HTML parsing")
+    parser.add_argument("--fixtures", help="Folder with saved indeed_*.html / glassdoor_*.html pages")
+    parser.add_argument("--write-fixtures", action="store_true", help="Save generated pages to --fixtures")
+    parser.add_argument("--pages", type=int, default=10, help="Synthetic pages per board")
+    parser.add_argument("--cards", type=int, default=15, help="Job cards per synthetic page")
+    parser.add_argument("--rounds", type=int, default=5, help="Passes over the page set")
+    args = parser.parse_args()
+
+    boards = {
+        "indeed": (_indeed_card, _bs4_indeed, extract_indeed_jobs),
+        "glassdoor": (_glassdoor_card, _bs4_glassdoor, extract_glassdoor_jobs),
+    }
+    rng = random.Random(7)
+
+    print(f"{'board':<12}{'pages':>7}{'before pages/s':>17}{'after pages/s':>16}{'speedup':>10}")
+    for board, (card, before, after) in boards.items():
+        pages = _load_pages(args.fixtures, board) if args.fixtures else []
+        if not pages:
+            pages = [_synthetic_page(card, rng, args.cards) for _ in range(args.pages)]
+            if args.fixtures and args.write_fixtures:
+                os.makedirs(args.fixtures, exist_ok=True)
+                for i, page in enumerate(pages):
+                    with open(os.path.join(args.fixtures, f"{board}_{i:03d}.html"), "w", encoding="utf-8") as f:
+                        f.write(page)
+
+        # Both implementations must agree before their speed is compared
+        for page in pages:
+            if [_comparable(job) for job in before(page)] != [_comparable(job) for job in after(page)]:
+                raise SystemExit(f"{board}: lxml extraction differs from BeautifulSoup output")
+
+        before_rate = _pages_per_second(before, pages, args.rounds)
+        after_rate = _pages_per_second(after, pages, args.rounds)
+        print(f"{board:<12}{len(pages):>7}{before_rate:>17.1f}{after_rate:>16.1f}{after_rate / before_rate:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Load-test harness for the mock job platform.
+
+Generates (or loads) a seeded synthetic corpus, replays a weighted mix of
+search and detail queries against `MockJobPlatformAPI` and reports latency
+percentiles and throughput per operation.
+
+Run from the `Assignment4/` folder:
+
+    python -m benchmarks.bench_job_platform --jobs 100000 --queries 5000
+    python -m benchmarks.bench_job_platform --snapshot /tmp/jobs.snap --jobs 1000000
+"""
+from typing import Awaitable, Callable, Dict, List, Tuple
+import argparse
+import asyncio
+import random
+import time
+
+from tools.mock_job_platform import MockJobPlatformAPI, _GENERAL_SKILLS, _LOCATIONS, _ROLE_SKILLS
+
+# Query shapes and how often each appears in the replayed mix
+QUERY_MIX = {
+    "keyword": 30,
+    "keyword+location": 15,
+    "skills": 25,
+    "keyword+skills": 10,
+    "paginated": 5,
+    "details": 10,
+    "bulk_details": 5,
+}
+
+
+def _build_queries(
+    api: MockJobPlatformAPI, count: int, seed: int
+) -> List[Tuple[str, Callable[[], Awaitable]]]:
+    """Build a reproducible list of (operation, coroutine factory) pairs."""
+    rng = random.Random(seed)
+    corpus_size = len(api._jobs_db)
+    roles = list(_ROLE_SKILLS)
+    keywords = [word for role in roles for word in role.lower().split()] + ["senior", "lead"]
+    operations = list(QUERY_MIX)
+    weights = list(QUERY_MIX.values())
+
+    def random_id() -> str:
+        return f"JOB-{rng.randint(1, corpus_size):04d}"
+
+    queries = []
+    for operation in rng.choices(operations, weights=weights, k=count):
+        if operation == "keyword":
+            query = " ".join(rng.sample(keywords, rng.randint(1, 2)))
+            factory = lambda q=query: api.search_jobs(q)
+        elif operation == "keyword+location":
+            query, location = rng.choice(keywords), rng.choice(_LOCATIONS)
+            factory = lambda q=query, l=location: api.search_jobs(q, location=l)
+        elif operation == "skills":
+            skills = rng.sample(_GENERAL_SKILLS[:10], rng.randint(1, 3))
+            factory = lambda s=skills: api.search_jobs("", skills=s)
+        elif operation == "keyword+skills":
+            role = rng.choice(roles)
+            skills = rng.sample(_ROLE_SKILLS[role][:4], 2)
+            factory = lambda q=role, s=skills: api.search_jobs(q, skills=s)
+        elif operation == "paginated":
+            query = rng.choice(keywords)
+            factory = lambda q=query: _read_pages(api, q, pages=3)
+        elif operation == "details":
+            factory = lambda job_id=random_id(): api.get_job_details(job_id)
+        else:
+            ids = [random_id() for _ in range(100)]
+            factory = lambda job_ids=ids: api.get_jobs_details(job_ids)
+        queries.append((operation, factory))
+    return queries
+
+
+async def _read_pages(api: MockJobPlatformAPI, query: str, pages: int) -> None:
+    """Fetch the first few pages of a query through the cursor API."""
+    cursor = None
+    for _ in range(pages):
+        page = await api.search_jobs_page(query, cursor=cursor)
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def _report(latencies: Dict[str, List[float]], wall_time: float) -> None:
+    """Print latency percentiles (ms) and throughput per operation."""
+    header = f"{'operation':<18}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'ops/s':>12}"
+    print(header)
+    print("-" * len(header))
+    everything = []
+    for operation in QUERY_MIX:
+        values = sorted(latencies.get(operation, []))
+        if not values:
+            continue
+        everything.extend(values)
+        throughput = len(values) / sum(values) if sum(values) else float("inf")
+        print(
+            f"{operation:<18}{len(values):>8}"
+            f"{_percentile(values, 50) * 1000:>10.3f}"
+            f"{_percentile(values, 95) * 1000:>10.3f}"
+            f"{_percentile(values, 99) * 1000:>10.3f}"
+            f"{throughput:>12.0f}"
+        )
+    everything.sort()
+    print("-" * len(header))
+    print(
+        f"{'all':<18}{len(everything):>8}"
+        f"{_percentile(everything, 50) * 1000:>10.3f}"
+        f"{_percentile(everything, 95) * 1000:>10.3f}"
+        f"{_percentile(everything, 99) * 1000:>10.3f}"
+        f"{len(everything) / wall_time:>12.0f}"
+    )
+
+
+async def run_benchmark(args: argparse.Namespace) -> None:
+    """Build the corpus, warm up and replay the query mix."""
+    start = time.perf_counter()
+    api = MockJobPlatformAPI(snapshot_path=args.snapshot, num_jobs=args.jobs, seed=args.seed)
+    print(f"Corpus ready: {len(api._jobs_db):,} jobs in {time.perf_counter() - start:.2f}s")
+
+    # Building the index decodes the whole corpus; time it separately
+    start = time.perf_counter()
+    api.warm_up()
+    print(f"Index built in {time.perf_counter() - start:.2f}s\n")
+
+    queries = _build_queries(api, args.queries, args.seed)
+    for _, factory in queries[:args.warmup]:
+        await factory()
+
+    latencies: Dict[str, List[float]] = {}
+    wall_start = time.perf_counter()
+    for operation, factory in queries:
+        start = time.perf_counter()
+        await factory()
+        latencies.setdefault(operation, []).append(time.perf_counter() - start)
+    _report(latencies, time.perf_counter() - wall_start)
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark MockJobPlatformAPI search and lookups")
+    parser.add_argument("--jobs", type=int, default=10_000, help="Corpus size to generate")
+    parser.add_argument("--queries", type=int, default=2_000, help="Number of queries to replay")
+    parser.add_argument("--warmup", type=int, default=100, help="Queries to run before measuring")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for corpus and query mix")
+    parser.add_argument("--snapshot", help="Corpus snapshot to load, or to create if missing")
+    asyncio.run(run_benchmark(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
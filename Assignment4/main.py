@@ -6,6 +6,7 @@ from pathlib import Path
 from rich import print
 from rich.console import Console
 from rich.panel import Panel
+from rich.live import Live
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
@@ -14,7 +15,9 @@ from agents.router import JobSearchRouter
 from agents.resume_parser import ResumeParserAgent
 from agents.job_searcher import JobSearchAgent
 from agents.relevance_scorer import RelevanceScorerAgent
+from tools.http_client import run_async
 from tools.mock_job_platform import MockJobPlatformAPI
+from tools.job_search.ranking import LiveTopK
 
 from dotenv import load_dotenv
 load_dotenv(override=True)  
@@ -137,7 +140,27 @@ class JobConnectSystem:
 
     def display_job_results(self, jobs: List[Dict], scores: Dict[str, Dict]):
         """Display job search results in a formatted table."""
-        table = Table(title="🎯 Job Matches", show_header=True, header_style="bold magenta")
+        # Sort jobs by score
+        sorted_jobs = sorted(
+            [(job, scores[job["id"]]) for job in jobs if job["id"] in scores],
+            key=lambda x: x[1]["total_score"],
+            reverse=True
+        )
+        
+        console.print("\n")
+        console.print(self.build_results_table(sorted_jobs))
+        console.print("\n💡 Jobs are ranked based on skill match, experience level, and overall qualitative assessment.")
+
+    def build_results_table(self, ranked_jobs: List, pending: Optional[set] = None, title: str = "🎯 Job Matches") -> Table:
+        """
+        Build the results table for (job, score) pairs in rank order.
+
+        Args:
+            ranked_jobs: (job, score) pairs, best first
+            pending: Ids of jobs whose score is still provisional (marked "est.")
+            title: Table title
+        """
+        table = Table(title=title, show_header=True, header_style="bold magenta")
         table.add_column("Rank", style="cyan", no_wrap=True)
         table.add_column("Score", style="green")
         table.add_column("Title", style="blue")
@@ -145,30 +168,46 @@ class JobConnectSystem:
         table.add_column("Location", style="magenta")
         table.add_column("Match Details", style="white")
         
-        # Sort jobs by score
-        sorted_jobs = sorted(
-            [(job, scores[job["id"]]) for job in jobs],
-            key=lambda x: x[1]["total_score"],
-            reverse=True
-        )
-        
-        for rank, (job, score) in enumerate(sorted_jobs, 1):
+        for rank, (job, score) in enumerate(ranked_jobs, 1):
             match_details = (
                 f"Skills: {score['skill_score']*100:.0f}% | "
                 f"Exp: {score['experience_score']*100:.0f}% | "
                 f"Overall: {score['qualitative_score']*100:.0f}%"
             )
+            estimate = " [dim](est.)[/dim]" if pending and job["id"] in pending else ""
             table.add_row(
                 str(rank),
-                f"{score['total_score']*100:.0f}%",
+                f"{score['total_score']*100:.0f}%{estimate}",
                 job["title"],
                 job["company"],
                 job["location"],
                 match_details
             )
-        
+        return table
+
+    async def score_jobs_live(self, top_k: int = 10):
+        """Score the found jobs, re-rendering the top matches as each score arrives."""
+        jobs_by_id = {job["id"]: job for job in self.state["job_listings"]}
+        ranking = LiveTopK(top_k)
+        pending = set()
+        scored = 0
+
+        def render() -> Table:
+            rows = [(jobs_by_id[job_id], score) for job_id, score in ranking.top()]
+            return self.build_results_table(
+                rows, pending, title=f"🎯 Job Matches ({scored} scored by AI, est. = provisional)"
+            )
+
         console.print("\n")
-        console.print(table)
+        with Live(render(), console=console, refresh_per_second=8) as live:
+            async for update in self.relevance_scorer.stream_scores(self.state):
+                ranking.update(update.job_id, update.score)
+                if update.provisional:
+                    pending.add(update.job_id)
+                else:
+                    pending.discard(update.job_id)
+                    scored += 1
+                live.update(render())
         console.print("\n💡 Jobs are ranked based on skill match, experience level, and overall qualitative assessment.")
 
     async def run(self):
@@ -237,20 +276,12 @@ class JobConnectSystem:
                         console.print("\n❌ No jobs to score yet. Try searching for jobs first!", style="red")
                         continue
 
-                    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
-                        task = progress.add_task("🎯 Scoring job matches...", total=None)
-                        msgs, self.state = await self.relevance_scorer.process(self.state)
-                        progress.update(task, completed=True)
-
-                    if self.state.get('job_scores'):
-                        self.display_job_results(
-                            self.state["job_listings"],
-                            self.state["job_scores"]
-                        )
+                    # Show the best matches as soon as they are scored
+                    await self.score_jobs_live()
 
                 # Cover letter generation
                 elif any(x in cmd for x in ['cover letter', 'write letter']):
-                    if not self.state.get('job_scores'):
+                    if not self.state.get('relevance_scores'):
                         console.print("\n❌ Please score jobs first to generate a targeted cover letter!", style="red")
                         continue
 
@@ -343,7 +374,7 @@ def main():
     """Entry point of the application."""
     try:
         system = JobConnectSystem()
-        asyncio.run(system.run())
+        run_async(system.run())
     except KeyboardInterrupt:
         console.print("\n👋 Goodbye!", style="blue")
     except Exception as e:
@@ -23,6 +23,7 @@ from typing import Dict, Optional
 
 # State type is defined in state.py at package root
 from state import JobSearchState, JobSearchStage
+from tools.http_client import run_async
 
 # Router and agents are imported lazily to avoid import-time LLM construction
 
@@ -221,7 +222,7 @@ def participant_node(state: JobSearchState) -> Dict:
     try:
         # Many agents implement async process(state)
         if asyncio.iscoroutinefunction(getattr(agent, "process", None)):
-            updated = asyncio.run(agent.process(state))
+            updated = run_async(agent.process(state))
         else:
             # sync process may return new state or a tuple
             updated = agent.process(state)
@@ -77,6 +77,7 @@ class JobSearchState(TypedDict):
     resume_data: Optional[ResumeData]
     search_query: Optional[Dict]
     job_listings: List[JobPosting]
+    source_status: Dict[str, str]
     relevance_scores: Dict[str, JobScore]
     generated_content: Dict[str, str]
     messages: List[Dict]
@@ -89,6 +90,7 @@ def create_initial_state() -> JobSearchState:
         resume_data=None,
         search_query=None,
         job_listings=[],
+        source_status={},
         relevance_scores={},
         generated_content={},
         messages=[],
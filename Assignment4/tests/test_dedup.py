@@ -0,0 +1,83 @@
+"""Tests for cross-source job deduplication."""
+import asyncio
+
+from tools.job_search.dedup import JobDeduplicator, normalize_company, normalize_title, simhash
+
+DESCRIPTION = (
+    "We are hiring a backend engineer to design and build scalable data pipelines, "
+    "own our Python services on AWS, mentor junior developers and work closely with "
+    "product managers on the roadmap for our analytics platform."
+)
+
+
+def _job(job_id, source, title="Senior Python Engineer", company="TechCorp Pte Ltd",
+         location="Singapore", description=DESCRIPTION):
+    return {
+        "id": job_id, "source": source, "title": title, "company": company,
+        "location": location, "description": description,
+    }
+
+
+def test_normalization_ignores_suffixes_and_abbreviations():
+    assert normalize_company("TechCorp Pte. Ltd.") == normalize_company("techcorp")
+    assert normalize_title("Sr. Python Eng") == normalize_title("Senior Python Engineer")
+
+
+def test_simhash_needs_enough_words():
+    assert simhash("too short to fingerprint") is None
+    assert simhash(DESCRIPTION) == simhash(DESCRIPTION.upper())
+
+
+def test_same_key_from_another_source_is_merged():
+    dedup = JobDeduplicator()
+    linkedin = _job("1", "LinkedIn", description="")
+    indeed = _job("a", "Indeed", company="TechCorp", title="Sr Python Engineer")
+
+    assert dedup.filter([linkedin, indeed]) == [linkedin]
+    assert dedup.duplicates == 1
+    assert linkedin["sources"] == ["LinkedIn", "Indeed"]
+    # Gaps in the kept job are filled from the duplicate
+    assert linkedin["description"] == DESCRIPTION
+
+
+def test_near_duplicate_text_is_found_through_lsh_bands():
+    dedup = JobDeduplicator()
+    original = _job("1", "LinkedIn", location="Singapore")
+    edited = _job("b", "Glassdoor", title="Python Engineer (Senior)", location="Singapore, SG",
+                  description=DESCRIPTION + " Apply today")
+
+    fingerprints = simhash(original["description"]), simhash(edited["description"])
+    assert bin(fingerprints[0] ^ fingerprints[1]).count("1") <= dedup.max_distance
+    assert set(dedup._band_keys(fingerprints[0])) & set(dedup._band_keys(fingerprints[1]))
+    assert dedup.filter([original, edited]) == [original]
+
+
+def test_different_jobs_and_same_source_repeats_are_kept():
+    dedup = JobDeduplicator()
+    jobs = [
+        _job("1", "LinkedIn"),
+        # Same company and text but an unrelated title
+        _job("2", "Indeed", title="Office Manager", location="Remote"),
+        # Same source lists the same role twice under different ids
+        _job("3", "LinkedIn"),
+        # Another company
+        _job("4", "Indeed", company="DataLabs"),
+    ]
+    assert dedup.filter(jobs) == jobs
+
+
+def test_repeated_source_and_id_is_dropped():
+    dedup = JobDeduplicator()
+    assert dedup.add(_job("1", "LinkedIn"))
+    assert not dedup.add(_job("1", "LinkedIn", title="Changed"))
+
+
+def test_filter_stream():
+    async def jobs():
+        for job in (_job("1", "LinkedIn"), _job("a", "Indeed"), _job("2", "LinkedIn", company="Other")):
+            yield job
+
+    async def collect():
+        return [job["id"] async for job in JobDeduplicator().filter_stream(jobs())]
+
+    assert asyncio.run(collect()) == ["1", "2"]
@@ -0,0 +1,45 @@
+"""Tests for lazy job description hydration."""
+import asyncio
+
+from tools.job_search import descriptions
+from tools.job_search.descriptions import hydrate_descriptions, needs_hydration
+
+
+def test_jobs_without_url_fall_back_to_summary():
+    jobs = [
+        {"id": "1", "source": "Indeed", "description": "", "summary": "Build APIs", "description_url": None},
+        {"id": "2", "source": "LinkedIn", "summary": "Ship models"},
+        {"id": "3", "source": "Indeed", "description": "Full text", "summary": "Short"},
+    ]
+    asyncio.run(hydrate_descriptions(jobs))
+    assert [job["description"] for job in jobs] == ["Build APIs", "Ship models", "Full text"]
+
+
+def test_fetched_description_is_cached_by_url(monkeypatch):
+    calls = []
+
+    async def fetch(url):
+        calls.append(url)
+        return f"Description of {url}"
+
+    monkeypatch.setitem(descriptions._FETCHERS, "TestSource", fetch)
+    monkeypatch.setattr(descriptions, "_cache", descriptions.OrderedDict())
+    jobs = [
+        {"id": str(i), "source": "TestSource", "summary": "Short", "description_url": "https://jobs.test/1"}
+        for i in range(3)
+    ]
+    assert all(needs_hydration(job) for job in jobs)
+
+    asyncio.run(hydrate_descriptions(jobs))
+    assert {job["description"] for job in jobs} == {"Description of https://jobs.test/1"}
+    assert calls == ["https://jobs.test/1"]
+
+
+def test_failed_fetch_falls_back_to_summary(monkeypatch):
+    async def fetch(url):
+        raise ConnectionError("offline")
+
+    monkeypatch.setitem(descriptions._FETCHERS, "TestSource", fetch)
+    job = {"id": "1", "source": "TestSource", "summary": "Short", "description_url": "https://jobs.test/down"}
+    asyncio.run(hydrate_descriptions([job]))
+    assert job["description"] == "Short"
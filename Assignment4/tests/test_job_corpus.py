@@ -0,0 +1,63 @@
+"""Tests for memory-mapped job corpus snapshots."""
+import pytest
+
+from tools.job_corpus import JobCorpus, write_snapshot
+from tools.mock_job_platform import MockJobPlatformAPI, generate_mock_jobs
+
+
+def test_snapshot_round_trip(tmp_path):
+    jobs = generate_mock_jobs(25, seed=7)
+    jobs[3]["requirements"] = []
+    jobs[4]["salary_range"] = None
+    jobs[5]["title"] = "Ingénieur logiciel · 東京"
+    path = tmp_path / "jobs.snap"
+
+    assert write_snapshot(iter(jobs), str(path), seed=7) == 25
+    corpus = JobCorpus(str(path))
+    try:
+        assert len(corpus) == 25
+        assert corpus.seed == 7
+        assert corpus[0] == jobs[0]
+        assert corpus[-1] == jobs[-1]
+        assert corpus[3]["requirements"] == []
+        assert corpus[4]["salary_range"] == ""
+        assert corpus[5]["title"] == jobs[5]["title"]
+        assert [job["id"] for job in corpus[10:13]] == [job["id"] for job in jobs[10:13]]
+        assert list(corpus.column("id")) == [job["id"] for job in jobs]
+        with pytest.raises(IndexError):
+            corpus[25]
+    finally:
+        corpus.close()
+
+
+def test_empty_snapshot_without_seed(tmp_path):
+    path = tmp_path / "empty.snap"
+    write_snapshot([], str(path))
+    corpus = JobCorpus(str(path))
+    assert len(corpus) == 0
+    assert corpus.seed is None
+    corpus.close()
+
+
+def test_rejects_files_that_are_not_snapshots(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"certainly not a snapshot file")
+    with pytest.raises(ValueError):
+        JobCorpus(str(path))
+
+
+def test_platform_regenerates_mismatched_snapshot(tmp_path):
+    path = str(tmp_path / "jobs.snap")
+    first = MockJobPlatformAPI(path, num_jobs=30, seed=1)
+    assert len(first._jobs_db) == 30
+
+    # Same size and seed: the snapshot is reused as is
+    reused = MockJobPlatformAPI(path, num_jobs=30, seed=1)
+    assert reused._jobs_db[0] == first._jobs_db[0]
+
+    resized = MockJobPlatformAPI(path, num_jobs=40, seed=1)
+    assert len(resized._jobs_db) == 40
+
+    reseeded = MockJobPlatformAPI(path, num_jobs=40, seed=2)
+    assert reseeded._jobs_db.seed == 2
+    assert JobCorpus(path).seed == 2
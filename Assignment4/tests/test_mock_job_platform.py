@@ -0,0 +1,195 @@
+"""Tests for BM25 search and cursor pagination on the mock job platform."""
+import asyncio
+import math
+from collections import Counter
+
+import pytest
+
+import tools.mock_job_platform as platform
+from tools.job_corpus import JobCorpus, write_snapshot
+from tools.mock_job_platform import MockJobPlatformAPI, _tokenize
+
+
+def _job(job_id, title, description, requirements=(), location="Singapore"):
+    return {
+        "id": job_id, "title": title, "company": "TechCorp", "location": location,
+        "description": description, "requirements": list(requirements),
+        "salary_range": "$5,000 - $7,000", "posting_date": "2024-01-01", "source": "MockJobPlatform",
+    }
+
+
+@pytest.fixture
+def api(tmp_path):
+    jobs = [
+        _job("J1", "Office Manager", "Keeps the office running; some python scripting", ["Excel"]),
+        _job("J2", "Python Developer", "Builds python services", ["Python", "SQL"]),
+        _job("J3", "Data Analyst", "SQL reports and dashboards", ["SQL"], location="Remote"),
+        _job("J4", "Rust Developer", "Systems programming in rust", ["Rust"]),
+        _job("J5", "Python Developer", "Builds python services", ["Python", "Docker"], location="Remote"),
+    ]
+    path = str(tmp_path / "jobs.snap")
+    write_snapshot(jobs, path)
+    return MockJobPlatformAPI(path, num_jobs=len(jobs))
+
+
+def _search(api, *args, **kwargs):
+    return [job["id"] for job in asyncio.run(api.search_jobs(*args, **kwargs))]
+
+
+def test_title_hits_outrank_incidental_mentions(api):
+    assert _search(api, "python") == ["J2", "J5", "J1"]
+
+
+def test_rarer_tokens_weigh_more(api):
+    # "rust" appears in one job, "developer" in three
+    assert _search(api, "rust developer", match_all=False)[0] == "J4"
+
+
+def test_match_all_and_match_any(api):
+    assert _search(api, "python sql") == ["J2"]
+    assert set(_search(api, "python sql", match_all=False)) == {"J1", "J2", "J3", "J5"}
+    assert _search(api, "python nosuchword") == []
+
+
+def test_filters(api):
+    assert _search(api, "python", location="remote") == ["J5"]
+    assert _search(api, "developer", skills=["python", "docker"]) == ["J5"]
+    assert _search(api, "python", location="Atlantis") == []
+    assert _search(api, "python", skills=["COBOL"]) == []
+
+
+def test_tokenless_query_keeps_corpus_order_and_limit(api):
+    assert _search(api, "") == ["J1", "J2", "J3", "J4", "J5"]
+    assert _search(api, "", max_results=2) == ["J1", "J2"]
+    assert _search(api, "", skills=["SQL"], max_results=1) == ["J2"]
+    assert _search(api, "...", location="Remote") == ["J3", "J5"]
+
+
+def test_ranking_matches_reference_bm25():
+    api = MockJobPlatformAPI(num_jobs=400, seed=11)
+    jobs = api._jobs_db
+    documents = [
+        Counter(
+            _tokenize(job["title"]) * platform._TITLE_WEIGHT + _tokenize(job["description"])
+            + _tokenize(" ".join(job["requirements"])) + _tokenize(job["location"])
+        )
+        for job in jobs
+    ]
+    lengths = [sum(document.values()) for document in documents]
+    average = sum(lengths) / len(lengths)
+
+    def reference(query):
+        tokens = set(_tokenize(query))
+        scored = []
+        for position, document in enumerate(documents):
+            if not tokens <= document.keys():
+                continue
+            score = 0.0
+            for token in tokens:
+                df = sum(1 for other in documents if token in other)
+                idf = math.log(1 + (len(documents) - df + 0.5) / (df + 0.5))
+                tf = document[token]
+                norm = platform._BM25_K1 * (1 - platform._BM25_B + platform._BM25_B * lengths[position] / average)
+                score += idf * tf * (platform._BM25_K1 + 1) / (tf + norm)
+            scored.append((-round(score, 9), position))
+        return [jobs[position]["id"] for _, position in sorted(scored)]
+
+    for query in ("engineer", "senior data scientist", "python docker", "lead cloud"):
+        expected = reference(query)
+        assert expected
+        assert _search(api, query, max_results=len(jobs)) == expected
+        assert _search(api, query, max_results=5) == expected[:5]
+
+
+async def _pages(api, query, page_size, **kwargs):
+    pages = []
+    cursor = None
+    while True:
+        page = await api.search_jobs_page(query, page_size=page_size, cursor=cursor, **kwargs)
+        pages.append(page)
+        cursor = page["next_cursor"]
+        if not cursor:
+            return pages
+
+
+def test_cursor_pages_cover_the_ranking_once():
+    api = MockJobPlatformAPI(num_jobs=300, seed=5)
+    ranked = _search(api, "engineer", max_results=300)
+    pages = asyncio.run(_pages(api, "engineer", page_size=7))
+
+    assert all(page["total"] == len(ranked) for page in pages)
+    assert [job["id"] for page in pages for job in page["jobs"]] == ranked
+    assert len(pages) == math.ceil(len(ranked) / 7)
+
+    async def iterate():
+        return [job["id"] async for job in api.iter_search_results("engineer", page_size=50)]
+
+    assert asyncio.run(iterate()) == ranked
+
+
+def test_cursor_survives_result_set_eviction(monkeypatch):
+    api = MockJobPlatformAPI(num_jobs=300, seed=5)
+    monkeypatch.setattr(platform, "_MAX_RESULT_POSITIONS", 50)
+
+    async def run():
+        first = await api.search_jobs_page("engineer", page_size=10)
+        # Other queries push the first result set out
+        for query in ("data", "senior", "developer"):
+            await api.search_jobs_page(query, page_size=10)
+        assert len(api._result_sets) == 1
+        second = await api.search_jobs_page(cursor=first["next_cursor"], page_size=10)
+        return first, second
+
+    first, second = asyncio.run(run())
+    ranked = _search(api, "engineer", max_results=20)
+    assert [job["id"] for job in first["jobs"] + second["jobs"]] == ranked
+
+
+def test_invalid_cursor():
+    api = MockJobPlatformAPI(num_jobs=10, seed=1)
+    with pytest.raises(ValueError):
+        asyncio.run(api.search_jobs_page(cursor="not-a-cursor"))
+
+
+@pytest.mark.parametrize("offset", [-5, "x"])
+def test_cursor_with_bad_offset_is_rejected(offset):
+    api = MockJobPlatformAPI(num_jobs=10, seed=1)
+    cursor = api._encode_cursor({"r": "gone", "o": offset, "q": "", "l": None, "s": None, "m": True})
+    with pytest.raises(ValueError):
+        asyncio.run(api.search_jobs_page(cursor=cursor))
+
+
+def test_cursor_offset_given_as_string_is_normalized():
+    api = MockJobPlatformAPI(num_jobs=10, seed=1)
+    cursor = api._encode_cursor({"r": "gone", "o": "2", "q": "", "l": None, "s": None, "m": True})
+    page = asyncio.run(api.search_jobs_page(page_size=3, cursor=cursor))
+    first = asyncio.run(api.search_jobs_page(page_size=5))
+    assert [job["id"] for job in page["jobs"]] == [job["id"] for job in first["jobs"][2:5]]
+
+
+@pytest.mark.parametrize("page_size", [0, -1])
+def test_non_positive_page_size_is_rejected(page_size):
+    api = MockJobPlatformAPI(num_jobs=10, seed=1)
+    with pytest.raises(ValueError):
+        asyncio.run(api.search_jobs_page(page_size=page_size))
+
+
+@pytest.mark.parametrize("contents", [
+    b"certainly not a snapshot file",
+    b"JOBSNAP1" + bytes(64),
+    b"",
+])
+def test_unreadable_snapshot_is_regenerated(tmp_path, contents):
+    path = tmp_path / "jobs.snap"
+    path.write_bytes(contents)
+    api = MockJobPlatformAPI(str(path), num_jobs=10, seed=1)
+    assert len(api._jobs_db) == 10
+    assert JobCorpus(str(path)).seed == 1
+
+
+def test_truncated_snapshot_is_regenerated(tmp_path):
+    path = tmp_path / "jobs.snap"
+    MockJobPlatformAPI(str(path), num_jobs=10, seed=1)._jobs_db.close()
+    path.write_bytes(path.read_bytes()[:40])
+    api = MockJobPlatformAPI(str(path), num_jobs=10, seed=1)
+    assert [job["id"] for job in api._jobs_db] == [job["id"] for job in JobCorpus(str(path))]
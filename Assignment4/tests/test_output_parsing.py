@@ -0,0 +1,141 @@
+"""Tests for parsing LLM replies into typed records."""
+import pytest
+
+from agents.output_parsing import (
+    extract_json,
+    parse_batch_reply,
+    parse_job_score,
+    parse_resume_data,
+    parse_score_reply,
+    to_score,
+)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('{"a": 1}', {"a": 1}),
+    ('```json\n{"a": 1}\n```', {"a": 1}),
+    ('Here you go: {"a": [1, 2,], "b": {"c": "}"},} Thanks!', {"a": [1, 2], "b": {"c": "}"}}),
+    ("{'a': True, 'b': None}", {"a": True, "b": None}),
+    ("{“a”: “x”}", {"a": "x"}),
+    ('[{"job_id": "1"}]', [{"job_id": "1"}]),
+])
+def test_extract_json_repairs_common_slips(text, expected):
+    assert extract_json(text) == expected
+
+
+@pytest.mark.parametrize("text", ["no json here", '{"a": 1', "{'a': \"b\", }x{"])
+def test_extract_json_rejects_unrecoverable_replies(text):
+    with pytest.raises(ValueError):
+        extract_json(text)
+
+
+@pytest.mark.parametrize("value, expected", [
+    (0.7, 0.7),
+    ("0.7", 0.7),
+    (85, 0.85),
+    ("85%", 0.85),
+    (8, 0.8),
+    ("7.5", 0.75),
+    ("8/10", 0.8),
+    ("4 out of 5", 0.8),
+    (1.5, 1.0),
+    (-0.2, 0.0),
+    (250, 1.0),
+])
+def test_to_score_normalizes_to_unit_range(value, expected):
+    assert to_score(value) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("value", [None, True, "n/a", ""])
+def test_to_score_rejects_non_numbers(value):
+    assert to_score(value) is None
+
+
+def test_parse_job_score_fills_missing_fields():
+    defaults = {"total_score": 0.5, "skill_score": 0.9, "experience_score": 0.3,
+                "qualitative_score": 0.4, "explanation": "Provisional"}
+    score = parse_job_score({"qualitative_score": "80%", "explanation": "Good fit"}, defaults)
+    assert score == {"total_score": 0.8, "skill_score": 0.9, "experience_score": 0.3,
+                     "qualitative_score": 0.8, "explanation": "Good fit"}
+
+    with pytest.raises(ValueError):
+        parse_job_score({"explanation": "No numbers"}, defaults)
+
+
+def test_parse_score_reply_reads_prose_fields():
+    reply = "Skill score: 80%\nExperience: 5 years in Python; score 60%\nCultural fit: 7/10\nOverall match: 3 out of 4"
+    score = parse_score_reply(reply)
+    assert score["skill_score"] == 0.8
+    assert score["experience_score"] == 0.6
+    assert score["qualitative_score"] == 0.7
+    assert score["total_score"] == 0.75
+
+
+def test_parse_score_reply_ignores_unscaled_numbers_without_a_score_word():
+    with pytest.raises(ValueError):
+        parse_score_reply("Experience: 5 years. Skills: 3 of the 4 listed.")
+
+
+@pytest.mark.parametrize("reply", [
+    '{"qualitative_score": 0.7, "explanation": "Good"}',
+    '{"scores": [{"qualitative_score": 0.7, "explanation": "Good"}]}',
+    '[{"qualitative_score": 0.7, "explanation": "Good"}]',
+])
+def test_parse_score_reply_accepts_json_shapes(reply):
+    score = parse_score_reply(reply, {"total_score": 0.5, "skill_score": 0.5, "experience_score": 0.5,
+                                      "qualitative_score": 0.5, "explanation": ""})
+    assert score["qualitative_score"] == 0.7
+    assert score["explanation"] == "Good"
+
+
+@pytest.mark.parametrize("reply", ['{"scores": [5]}', '[5]', '[]'])
+def test_parse_score_reply_rejects_entries_that_are_not_objects(reply):
+    with pytest.raises(ValueError):
+        parse_score_reply(reply)
+
+
+def test_parse_batch_reply_skips_invalid_entries():
+    reply = """```json
+    {"scores": [
+        {"job_id": 1, "qualitative_score": 0.9, "explanation": "Strong"},
+        {"job_id": "2", "explanation": "No score"},
+        {"qualitative_score": 0.5},
+        "junk",
+    ]}
+    ```"""
+    scores = parse_batch_reply(reply)
+    assert list(scores) == ["1"]
+    assert scores["1"]["qualitative_score"] == 0.9
+
+    with pytest.raises(ValueError):
+        parse_batch_reply('{"result": "none"}')
+
+
+def test_parse_resume_data_coerces_variants():
+    resume = parse_resume_data({
+        "personal_info": {"name": " Ada  Lovelace ", "email": "ada@example.com"},
+        "work_experience": [{"company": "Engines", "title": "Analyst", "start_date": 1843,
+                             "description": "Wrote programs\nTranslated notes"}],
+        "education": {"degree": "BSc", "school": "Home", "gpa": "3.9/4.0"},
+        "skills": {"technical": "Python, SQL", "soft": ["Writing", "Python"]},
+    })
+    assert resume["personal_info"]["name"] == "Ada Lovelace"
+    assert resume["personal_info"]["phone"] is None
+    assert resume["experience"][0]["position"] == "Analyst"
+    assert resume["experience"][0]["start_date"] == "1843"
+    assert resume["experience"][0]["description"] == ["Wrote programs", "Translated notes"]
+    assert resume["education"][0]["institution"] == "Home"
+    assert resume["education"][0]["gpa"] == 3.9
+    assert resume["skills"] == ["Python", "SQL", "Writing"]
+    assert resume["projects"] == []
+
+
+@pytest.mark.parametrize("data", [
+    ["not", "a", "dict"],
+    {"name": "No sections"},
+    {"experience": 5},
+    {"skills": ["Python"], "education": "BSc, NUS"},
+])
+def test_parse_resume_data_rejects_non_resumes(data):
+    with pytest.raises(ValueError):
+        parse_resume_data(data)
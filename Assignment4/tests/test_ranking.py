@@ -0,0 +1,83 @@
+"""Tests for the live top-K ranking and the streaming results view."""
+import io
+import json
+
+from langchain_core.messages import AIMessage
+from rich.console import Console
+
+import main
+from agents.relevance_scorer import RelevanceScorerAgent
+from tools.http_client import run_async
+from tools.job_search.prescoring import prescore_jobs
+from tools.job_search.ranking import LiveTopK
+from tools.mock_job_platform import generate_mock_jobs
+
+
+def _score(total):
+    return {"total_score": total, "skill_score": total, "experience_score": total,
+            "qualitative_score": total, "explanation": ""}
+
+
+def test_live_top_k_follows_score_changes():
+    ranking = LiveTopK(k=2)
+    for job_id, total in [("a", 0.5), ("b", 0.7), ("c", 0.6)]:
+        ranking.update(job_id, _score(total))
+    assert [job_id for job_id, _ in ranking.top()] == ["b", "c"]
+
+    ranking.update("a", _score(0.9))
+    ranking.update("b", _score(0.1))
+    assert [job_id for job_id, _ in ranking.top()] == ["a", "c"]
+    assert ranking.top()[0][1]["total_score"] == 0.9
+    assert len(ranking) == 3 and "b" in ranking and "z" not in ranking
+
+
+def test_live_top_k_ties_keep_update_order():
+    ranking = LiveTopK(k=3)
+    for job_id in "xyz":
+        ranking.update(job_id, _score(0.5))
+    assert [job_id for job_id, _ in ranking.top()] == ["x", "y", "z"]
+
+
+class FakeLLM:
+    """Scores every job in a batched request as a strong qualitative fit."""
+
+    model_name = "fake"
+
+    async def apredict_messages(self, messages):
+        prompt = messages[-1].content
+        job_ids = [line.split(": ", 1)[1] for line in prompt.splitlines() if line.startswith("Job ID: ")]
+        scores = [{"job_id": job_id, "qualitative_score": 0.95, "explanation": "Great fit"} for job_id in job_ids]
+        return AIMessage(content=json.dumps({"scores": scores}))
+
+
+def test_score_jobs_live_renders_the_ranking(monkeypatch):
+    output = io.StringIO()
+    monkeypatch.setattr(main, "console", Console(file=output, width=200, color_system=None))
+
+    jobs = generate_mock_jobs(12, seed=3)
+    for job in jobs:
+        # Nothing to hydrate over the network
+        job["description_url"] = None
+    system = main.JobConnectSystem.__new__(main.JobConnectSystem)
+    system.relevance_scorer = RelevanceScorerAgent(FakeLLM(), top_k=4, use_cache=False)
+    system.state = {
+        "job_listings": jobs,
+        "resume_data": {"skills": ["Python", "SQL", "Docker"], "experience": []},
+        "search_query": {},
+    }
+
+    run_async(system.score_jobs_live(top_k=5))
+
+    rendered = output.getvalue()
+    assert "4 scored by AI" in rendered
+    assert "Job Matches" in rendered
+    assert system.state["current_stage"] == "jobs_scored"
+    assert len(system.state["score_explanations"]) == 4
+    assert set(system.state["score_explanations"].values()) == {"Great fit"}
+    # LLM scores replace only the qualitative part of the provisional ones
+    provisional = prescore_jobs(jobs, system.state["resume_data"])
+    for job_id in system.state["score_explanations"]:
+        score = system.state["relevance_scores"][job_id]
+        assert score["qualitative_score"] == 0.95
+        assert score["skill_score"] == provisional[job_id]["skill_score"]
+        assert score["total_score"] > provisional[job_id]["total_score"]
@@ -0,0 +1,96 @@
+"""Tests for the adaptive per-host token bucket."""
+import asyncio
+
+import httpx
+import pytest
+
+from tools import rate_limiter
+from tools.rate_limiter import TokenBucket, configure_host, request_with_retries, retry_after_seconds
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", clock)
+    return clock
+
+
+def test_burst_then_steady_rate(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    assert [bucket.reserve() for _ in range(5)] == [0, 0, 0, 0.5, 1.0]
+
+
+def test_tokens_refill_up_to_burst(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    for _ in range(3):
+        bucket.reserve()
+    clock.now += 100
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 0, 0.5]
+
+
+def test_throttle_spreads_queued_requests_after_the_pause(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    for _ in range(3):
+        bucket.reserve()
+    bucket.throttled(3.0)
+    assert bucket.rate == 1
+
+    # Waits stack on top of the pause at the halved rate
+    assert [bucket.reserve() for _ in range(3)] == [4.0, 5.0, 6.0]
+
+    # A shorter pause does not cut the current one short
+    clock.now += 1
+    bucket.throttled(0.5)
+    assert bucket.reserve() == pytest.approx(2 + 4 / 0.5)
+
+
+def test_throttle_with_tokens_left_still_starts_empty(clock):
+    bucket = TokenBucket(rate=4, burst=4)
+    bucket.throttled(1.0)
+    assert [bucket.reserve() for _ in range(2)] == [1.5, 2.0]
+
+
+def test_rate_recovers_and_respects_bounds(clock):
+    bucket = TokenBucket(rate=10, burst=1, min_rate=2)
+    for _ in range(5):
+        bucket.throttled(0)
+    assert bucket.rate == 2
+    for _ in range(20):
+        bucket.succeeded()
+    assert bucket.rate == 10
+
+
+def test_retry_after_header():
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "7"})) == 7
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "soon"})) is None
+    assert retry_after_seconds(httpx.Response(429)) is None
+
+
+def test_request_with_retries_throttles_and_retries(monkeypatch):
+    statuses = [429, 503, 200]
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(statuses[len(requests) - 1], headers={"Retry-After": "0"})
+
+    monkeypatch.setattr(rate_limiter, "backoff_delay", lambda attempt: 0.0)
+    configure_host("jobs.test", rate=1000, burst=10)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await request_with_retries(client, "GET", "https://jobs.test/search")
+
+    response = asyncio.run(run())
+    assert response.status_code == 200
+    assert len(requests) == 3
+    # Two throttling responses halved the rate twice, the success restored a tenth
+    assert rate_limiter.get_rate_limiter("jobs.test").rate == pytest.approx(250 + 100)
@@ -0,0 +1,76 @@
+"""Tests for the relevance scoring agent."""
+import asyncio
+import json
+import sqlite3
+
+from langchain_core.messages import AIMessage
+
+from agents import relevance_scorer
+from agents.relevance_scorer import RelevanceScorerAgent
+from tools.mock_job_platform import generate_mock_jobs
+
+
+class FakeLLM:
+    """Replies to batched and single-job prompts with a fixed qualitative score."""
+
+    model_name = "fake"
+
+    def __init__(self):
+        self.prompts = []
+
+    async def apredict_messages(self, messages):
+        prompt = messages[-1].content
+        self.prompts.append(prompt)
+        job_ids = [line.split(": ", 1)[1] for line in prompt.splitlines() if line.startswith("Job ID: ")]
+        if not job_ids:
+            return AIMessage(content='{"qualitative_score": 0.8, "explanation": "Solid fit"}')
+        scores = [{"job_id": job_id, "qualitative_score": 0.8, "explanation": "Solid fit"} for job_id in job_ids]
+        return AIMessage(content=json.dumps({"scores": scores}))
+
+
+def _state(jobs):
+    return {
+        "job_listings": jobs,
+        "resume_data": {"skills": ["Python", "SQL"], "experience": []},
+        "search_query": {},
+    }
+
+
+def test_process_returns_llm_scores_as_a_message():
+    state = _state(generate_mock_jobs(10, seed=2))
+    agent = RelevanceScorerAgent(FakeLLM(), top_k=3, use_cache=False)
+
+    messages, state = asyncio.run(agent.process(state))
+
+    assert isinstance(messages[0], AIMessage)
+    scores = json.loads(messages[0].content)
+    assert len(scores) == 3
+    assert all(score["qualitative_score"] == 0.8 for score in scores.values())
+    assert state["current_stage"] == "jobs_scored"
+    assert len(state["relevance_scores"]) == 10
+
+
+def test_jobs_without_description_url_are_scored_from_their_summary():
+    job = {
+        "id": "indeed-1", "title": "Data Engineer", "company": "DataLabs", "location": "Singapore",
+        "description": "", "summary": "Build Spark pipelines in Python", "description_url": None,
+        "requirements": [], "source": "Indeed",
+    }
+    llm = FakeLLM()
+    agent = RelevanceScorerAgent(llm, top_k=1, batched=False, use_cache=False)
+
+    asyncio.run(agent.process(_state([job])))
+
+    assert "Build Spark pipelines in Python" in str(llm.prompts)
+
+
+def test_unavailable_score_cache_is_skipped(monkeypatch):
+    def locked():
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(relevance_scorer, "get_score_cache", locked)
+    agent = RelevanceScorerAgent(FakeLLM(), top_k=3)
+
+    assert agent.score_cache is None
+    _, state = asyncio.run(agent.process(_state(generate_mock_jobs(5, seed=2))))
+    assert len(state["relevance_scores"]) == 5
@@ -0,0 +1,94 @@
+"""Tests for the caching resume parser agent."""
+import asyncio
+import json
+import sqlite3
+
+from langchain_core.messages import AIMessage
+
+from agents import resume_parser
+from agents.resume_parser import ResumeParserAgent
+from tools.sqlite_store import SQLiteStore
+
+RESUME = {"personal_info": {"name": "Ada", "email": "ada@example.com"}, "skills": ["Python"]}
+
+
+class FakeLLM:
+    """Replies with the queued contents in order."""
+
+    model_name = "fake"
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.calls = 0
+
+    async def apredict_messages(self, messages):
+        self.calls += 1
+        return AIMessage(content=self.replies.pop(0))
+
+
+def _agent(tmp_path, llm):
+    resume_parser._memory_cache.clear()
+    return ResumeParserAgent(llm, store=SQLiteStore(str(tmp_path / "cache.sqlite3"), table="parsed_resumes"))
+
+
+def test_malformed_reply_is_retried(tmp_path):
+    llm = FakeLLM(json.dumps({"experience": 5}), json.dumps(RESUME))
+    agent = _agent(tmp_path, llm)
+
+    messages, state = asyncio.run(agent.process({"resume_text": "Ada\nPython"}))
+
+    assert llm.calls == 2
+    assert len(messages) == 2
+    assert state["resume_data"]["skills"] == ["Python"]
+
+
+def test_parsed_resume_is_reused_across_whitespace_changes(tmp_path):
+    llm = FakeLLM(json.dumps(RESUME))
+    agent = _agent(tmp_path, llm)
+
+    asyncio.run(agent.process({"resume_text": "Ada\nPython"}))
+    resume_parser._memory_cache.clear()
+    _, state = asyncio.run(agent.process({"resume_text": "  Ada  \n\nPython "}))
+
+    assert llm.calls == 1
+    assert state["resume_data"]["personal_info"]["name"] == "Ada"
+
+
+def test_unusable_cache_row_is_discarded(tmp_path):
+    llm = FakeLLM(json.dumps(RESUME))
+    agent = _agent(tmp_path, llm)
+    key = agent._cache_key("Ada\nPython")
+    agent.store.set(key, {"experience": 5})
+
+    _, state = asyncio.run(agent.process({"resume_text": "Ada\nPython"}))
+
+    assert llm.calls == 1
+    assert state["resume_data"]["skills"] == ["Python"]
+    assert agent.store.get(key)["skills"] == ["Python"]
+
+
+def test_unavailable_store_disables_the_cache(monkeypatch):
+    def unwritable():
+        raise PermissionError("~/.cache is read-only")
+
+    monkeypatch.setattr(resume_parser, "get_resume_store", unwritable)
+    resume_parser._memory_cache.clear()
+    llm = FakeLLM(json.dumps(RESUME), json.dumps(RESUME))
+    agent = ResumeParserAgent(llm)
+
+    assert agent.store is None
+    asyncio.run(agent.process({"resume_text": "Ada\nPython"}))
+    asyncio.run(agent.process({"resume_text": "Ada\nPython"}))
+    assert llm.calls == 2
+
+
+def test_locked_store_disables_the_cache(monkeypatch):
+    def locked():
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(resume_parser, "get_resume_store", locked)
+    agent = ResumeParserAgent(FakeLLM(json.dumps(RESUME)))
+
+    assert not agent.use_cache
+    _, state = asyncio.run(agent.process({"resume_text": "Ada\nPython"}))
+    assert state["resume_data"]["skills"] == ["Python"]
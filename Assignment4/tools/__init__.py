@@ -5,7 +5,14 @@ This file makes `tools` a proper package so subpackages like
 """
 
 __all__ = [
+    "config",
     "linkedin_scraper",
     "web_scraper",
     "mock_job_platform",
+    "job_corpus",
+    "http_client",
+    "http_cache",
+    "rate_limiter",
+    "webdriver_pool",
+    "sqlite_store",
 ]
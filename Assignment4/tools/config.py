@@ -0,0 +1,27 @@
+"""Settings read from the environment (or `.env`).
+
+The tools are tuned through `JOBCONNECT_*` environment variables; each
+module documents the ones it reads and calls `env_number` with its default.
+"""
+import os
+
+
+def env_number(name: str, default: float) -> float:
+    """
+    Read a numeric setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset, empty or not a number
+
+    Returns:
+        The setting as a float
+    """
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        print(f"Ignoring invalid {name}={value!r}, using {default}")
+        return default
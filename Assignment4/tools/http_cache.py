@@ -0,0 +1,162 @@
+"""On-disk HTTP response cache for the scrapers.
+
+Responses are stored one JSON file per request, keyed by a hash of the URL
+and query parameters. An entry younger than the TTL is served without any
+request; an older one is revalidated with `If-None-Match` /
+`If-Modified-Since` so an unchanged page costs a 304 instead of a full
+download. The cache directory is kept under a size limit by evicting the
+least recently used entries.
+
+Settings come from environment variables (or `.env`):
+
+    JOBCONNECT_HTTP_CACHE_DIR     cache folder (default ~/.cache/jobconnect/http)
+    JOBCONNECT_HTTP_CACHE_TTL     seconds an entry is served without revalidation (default 300)
+    JOBCONNECT_HTTP_CACHE_MAX_MB  size limit of the cache folder (default 100)
+"""
+from typing import Dict, Mapping, Optional
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from tools.config import env_number
+
+
+class HTTPCache:
+    """Size-bounded LRU cache of HTTP response bodies on disk."""
+
+    def __init__(self, directory: str, ttl: float = 300.0, max_bytes: int = 100 * 1024 * 1024):
+        """
+        Args:
+            directory: Folder the entries are stored in
+            ttl: Seconds an entry is served without revalidation
+            max_bytes: Size limit of the folder; least recently used entries
+                are evicted beyond it
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(url: str, params: Optional[Mapping] = None) -> str:
+        """Build the cache key for a request."""
+        canonical = json.dumps(
+            [url, sorted((str(k), str(v)) for k, v in (params or {}).items())],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def lookup(self, key: str) -> Optional[Dict]:
+        """Return the stored entry for a key (fresh or stale), or None."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        try:
+            # The file's mtime records the last use for LRU eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """Whether an entry can be served without revalidation."""
+        return time.time() - entry.get("stored_at", 0) < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict]) -> Dict[str, str]:
+        """Request headers that let the server answer 304 for an unchanged entry."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, key: str, url: str, headers: Mapping[str, str], body: str) -> None:
+        """Store a 200 response unless the server forbids it."""
+        if "no-store" in headers.get("cache-control", "").lower():
+            return
+        self._write(key, {
+            "url": url,
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "stored_at": time.time(),
+            "body": body,
+        })
+        self._evict()
+
+    def refresh(self, key: str, entry: Dict, headers: Mapping[str, str]) -> None:
+        """Mark an entry as fresh again after a 304 response."""
+        entry = dict(entry)
+        entry["stored_at"] = time.time()
+        entry["etag"] = headers.get("etag") or entry.get("etag")
+        entry["last_modified"] = headers.get("last-modified") or entry.get("last_modified")
+        self._write(key, entry)
+
+    def _write(self, key: str, entry: Dict) -> None:
+        """Atomically replace an entry file."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the folder fits `max_bytes`."""
+        with self._lock:
+            entries = []
+            total = 0
+            with os.scandir(self.directory) as it:
+                for item in it:
+                    if not item.name.endswith(".json"):
+                        continue
+                    try:
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, item.path))
+                    total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+            for _, size, path in sorted(entries):
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+
+_cache: Optional[HTTPCache] = None
+
+
+def get_http_cache() -> HTTPCache:
+    """Return the process-wide HTTP cache configured from the environment."""
+    global _cache
+    if _cache is None:
+        directory = os.getenv("JOBCONNECT_HTTP_CACHE_DIR") or os.path.join(
+            os.path.expanduser("~"), ".cache", "jobconnect", "http"
+        )
+        _cache = HTTPCache(
+            directory,
+            ttl=env_number("JOBCONNECT_HTTP_CACHE_TTL", 300.0),
+            max_bytes=int(env_number("JOBCONNECT_HTTP_CACHE_MAX_MB", 100) * 1024 * 1024),
+        )
+    return _cache
@@ -0,0 +1,122 @@
+"""Shared, pooled HTTP client for all outbound requests made by the tools.
+
+Every scraper should call `get_http_client()` instead of creating its own
+client so that connections (DNS, TCP and TLS setup) are reused across
+requests and searches. HTTP/2 is used when the optional `h2` package is
+installed.
+
+Pool sizes can be tuned through environment variables (or `.env`):
+
+    JOBCONNECT_HTTP_MAX_CONNECTIONS   total open connections (default 20)
+    JOBCONNECT_HTTP_MAX_KEEPALIVE     idle connections kept open (default 10)
+    JOBCONNECT_HTTP_KEEPALIVE_EXPIRY  seconds before an idle connection is closed (default 30)
+    JOBCONNECT_HTTP_TIMEOUT           default request timeout in seconds (default 15)
+
+A client's connections belong to the event loop that opened them. Code that
+drives the tools with its own event loop should use `run_async` instead of
+`asyncio.run`: it closes the loop's client (and drops the other per-loop
+state kept with `loop_local`) before the loop shuts down, so no sockets are
+left open when the next run builds a fresh pool.
+"""
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+import asyncio
+import importlib.util
+import weakref
+
+import httpx
+
+from tools.config import env_number
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; JobSearchBot/1.0)"
+}
+
+T = TypeVar("T")
+
+# Objects bound to one event loop (the pooled client, semaphores, in-flight
+# fetches), keyed by loop. `close_http_client` drops a loop's entry when the
+# run ends; weak keys only catch loops that were never closed that way.
+_loop_state: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+_limits: Optional[httpx.Limits] = None
+_timeout: Optional[float] = None
+
+
+def configure_http_client(
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    timeout: Optional[float] = None
+) -> None:
+    """
+    Override the pool settings for clients created from now on.
+
+    Arguments left as None fall back to the environment variables / defaults.
+
+    Args:
+        max_connections: Maximum number of open connections
+        max_keepalive_connections: Maximum number of idle connections kept open
+        keepalive_expiry: Seconds an idle connection is kept before eviction
+        timeout: Default request timeout in seconds
+    """
+    global _limits, _timeout
+    _limits = httpx.Limits(
+        max_connections=max_connections or int(env_number("JOBCONNECT_HTTP_MAX_CONNECTIONS", 20)),
+        max_keepalive_connections=max_keepalive_connections or int(env_number("JOBCONNECT_HTTP_MAX_KEEPALIVE", 10)),
+        keepalive_expiry=keepalive_expiry or env_number("JOBCONNECT_HTTP_KEEPALIVE_EXPIRY", 30.0),
+    )
+    _timeout = timeout or env_number("JOBCONNECT_HTTP_TIMEOUT", 15.0)
+
+
+def loop_local(name: str, factory: Callable[[], T]) -> T:
+    """
+    Return the running event loop's object stored under `name`.
+
+    Args:
+        name: Key of the object, unique across modules
+        factory: Creates the object on first use in a loop
+
+    Returns:
+        The object, released when the loop's run ends (see `run_async`)
+    """
+    state = _loop_state.setdefault(asyncio.get_running_loop(), {})
+    if name not in state:
+        state[name] = factory()
+    return state[name]
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the pooled client for the running event loop, creating it on first use."""
+    state = _loop_state.setdefault(asyncio.get_running_loop(), {})
+    client = state.get("http_client")
+    if client is None or client.is_closed:
+        if _limits is None:
+            configure_http_client()
+        client = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            limits=_limits,
+            timeout=_timeout,
+            follow_redirects=True,
+            http2=importlib.util.find_spec("h2") is not None,
+        )
+        state["http_client"] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the pooled client of the running event loop and drop its per-loop state."""
+    state = _loop_state.pop(asyncio.get_running_loop(), {})
+    client = state.get("http_client")
+    if client is not None:
+        await client.aclose()
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """Run a coroutine with `asyncio.run`, closing the loop's HTTP client when it ends."""
+    async def run() -> T:
+        try:
+            return await coro
+        finally:
+            await close_http_client()
+
+    return asyncio.run(run())
@@ -0,0 +1,173 @@
+"""Persistent, memory-mapped job corpus snapshots.
+
+A snapshot stores job postings column by column in a single binary file:
+
+    magic (8 bytes) | job count (uint32) | field count (uint32) | seed (int64)
+    offsets table   (uint64 x field count x (job count + 1))
+    string data     (UTF-8, one contiguous run per field)
+
+The value of field `f` for job `i` is `data[offsets[f][i]:offsets[f][i + 1]]`.
+The seed the corpus was generated from is recorded so a loader can tell
+whether the snapshot is the corpus it asked for.
+Opening a snapshot only maps the file, so startup cost does not depend on the
+corpus size and several worker processes share the same pages through the
+OS page cache. Jobs are decoded on access.
+"""
+from typing import Dict, Iterable, Iterator, Optional, Sequence
+from array import array
+from contextlib import ExitStack
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+
+MAGIC = b"JOBSNAP2"
+_HEADER = struct.Struct("<8sIIq")
+
+# Header seed value of a corpus generated without a seed
+_NO_SEED = -2 ** 63
+
+# Field order of the snapshot columns
+FIELDS = (
+    "id", "title", "company", "location", "description",
+    "requirements", "salary_range", "posting_date", "source",
+)
+
+# Requirements are stored as one string joined with the ASCII unit separator
+_LIST_SEPARATOR = "\x1f"
+
+
+def write_snapshot(jobs: Iterable[Dict], path: str, seed: Optional[int] = None) -> int:
+    """
+    Write job postings to a columnar snapshot file.
+
+    Jobs are consumed in a single pass, each column being spooled to its own
+    temporary file, so generators of any size can be written without holding
+    the corpus in memory. The result is moved into place atomically, so
+    readers never observe a partially written snapshot.
+
+    Args:
+        jobs: Job postings using the `MockJobPlatformAPI` job shape
+        path: Destination file path
+        seed: Seed the jobs were generated from, recorded in the header
+
+    Returns:
+        Number of jobs written
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    column_offsets = [array("Q", [0]) for _ in FIELDS]
+    column_sizes = [0] * len(FIELDS)
+    count = 0
+
+    with ExitStack() as stack:
+        spools = [stack.enter_context(tempfile.TemporaryFile(dir=directory)) for _ in FIELDS]
+        for job in jobs:
+            for column, field in enumerate(FIELDS):
+                value = job.get(field)
+                if field == "requirements":
+                    value = _LIST_SEPARATOR.join(value or [])
+                encoded = ("" if value is None else str(value)).encode("utf-8")
+                spools[column].write(encoded)
+                column_sizes[column] += len(encoded)
+                column_offsets[column].append(column_sizes[column])
+            count += 1
+
+        # Offsets are global positions into the data section
+        offsets = array("Q")
+        base = 0
+        for column in range(len(FIELDS)):
+            offsets.extend(offset + base for offset in column_offsets[column])
+            base += column_sizes[column]
+        if sys.byteorder != "little":
+            offsets.byteswap()
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(MAGIC, count, len(FIELDS), _NO_SEED if seed is None else seed))
+                offsets.tofile(f)
+                for spool in spools:
+                    spool.seek(0)
+                    shutil.copyfileobj(spool, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    return count
+
+
+class JobCorpus(Sequence):
+    """Read-only, memory-mapped view over a job snapshot file.
+
+    Behaves like a list of job dicts; each access decodes a fresh dict from
+    the mapped file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < _HEADER.size or not self._mmap[:len(MAGIC)].startswith(b"JOBSNAP"):
+            self._mmap.close()
+            raise ValueError(f"Not a job corpus snapshot: {path}")
+        magic, self._count, field_count, seed = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or field_count != len(FIELDS):
+            self._mmap.close()
+            raise ValueError(f"Unsupported job corpus snapshot format (delete it to regenerate): {path}")
+        # Seed the corpus was generated from (None if unknown)
+        self.seed: Optional[int] = None if seed == _NO_SEED else seed
+
+        table_start = _HEADER.size
+        table_end = table_start + 8 * field_count * (self._count + 1)
+        if len(self._mmap) < table_end:
+            self._mmap.close()
+            raise ValueError(f"Truncated job corpus snapshot: {path}")
+        self._data_start = table_end
+
+        if sys.byteorder == "little":
+            self._offsets = memoryview(self._mmap)[table_start:table_end].cast("Q")
+        else:
+            # Native casts would read the little-endian table wrongly
+            self._offsets = array("Q", self._mmap[table_start:table_end])
+            self._offsets.byteswap()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("job corpus index out of range")
+
+        job = {field: self._value(column, index) for column, field in enumerate(FIELDS)}
+        job["requirements"] = job["requirements"].split(_LIST_SEPARATOR) if job["requirements"] else []
+        return job
+
+    def column(self, field: str) -> Iterator[str]:
+        """Iterate over the raw string values of one field for every job."""
+        column = FIELDS.index(field)
+        for index in range(self._count):
+            yield self._value(column, index)
+
+    def _value(self, column: int, index: int) -> str:
+        """Decode the string stored for one field of one job."""
+        base = column * (self._count + 1) + index
+        start = self._data_start + self._offsets[base]
+        end = self._data_start + self._offsets[base + 1]
+        return self._mmap[start:end].decode("utf-8")
+
+    def close(self) -> None:
+        """Unmap the snapshot file."""
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._mmap.close()
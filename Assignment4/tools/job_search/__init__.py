@@ -3,7 +3,12 @@
 This package provides thin adapter modules so callers can use
 `from tools.job_search.linkedin_scraper import ...` while keeping the
 existing scraper implementations at `tools/linkedin_scraper.py` and
-`tools/web_scraper.py`.
+`tools/web_scraper.py`, plus job-search helpers shared by the agents
+(e.g. lazy description hydration in `descriptions`, cross-source
+deduplication in `dedup`, the pluggable `JobSource` registry in
+`sources`, the deterministic pre-scorer in `prescoring`, the
+persistent LLM score cache in `score_cache` and the live top-K
+ranking in `ranking`).
 """
 
-__all__ = ["linkedin_scraper", "web_scraper"]
+__all__ = ["linkedin_scraper", "web_scraper", "descriptions", "dedup", "sources", "prescoring", "score_cache", "ranking"]
@@ -0,0 +1,198 @@
+"""Cross-source job deduplication.
+
+The same posting often appears on several sources with slightly different
+titles, company suffixes or location strings. `JobDeduplicator` keeps the
+first copy it sees and drops later copies from *other* sources when either
+
+- their normalized (title, company, location) key is identical, or
+- they are from the same company, have similar titles, and their text
+  (description, or summary before hydration) is a near duplicate: the
+  64-bit SimHash fingerprints differ in at most `max_distance` bits.
+
+Near duplicates are found through LSH banding: the fingerprint is split
+into `max_distance + 1` bands, and two fingerprints within the distance
+must agree on at least one whole band, so only jobs sharing a band bucket
+are compared. Jobs are processed one at a time, so the deduplicator can
+sit on a stream of results as they arrive.
+"""
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+import hashlib
+import re
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+
+# Company name endings that do not distinguish employers
+_COMPANY_SUFFIXES = {
+    "pte", "ltd", "limited", "inc", "incorporated", "llc", "llp", "plc",
+    "corp", "corporation", "co", "company", "gmbh", "sdn", "bhd", "group",
+}
+
+# Common title abbreviations
+_TITLE_ALIASES = {"sr": "senior", "jr": "junior", "snr": "senior", "eng": "engineer", "dev": "developer"}
+
+_FINGERPRINT_BITS = 64
+
+# Texts shorter than this many words are too short for a reliable fingerprint
+_MIN_FINGERPRINT_WORDS = 12
+
+
+def _words(text: str) -> List[str]:
+    return _WORD_RE.findall((text or "").lower())
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase, expand abbreviations and drop bracketed qualifiers."""
+    title = re.sub(r"\(.*?\)|\[.*?\]", " ", title or "")
+    return " ".join(_TITLE_ALIASES.get(word, word) for word in _words(title))
+
+
+def normalize_company(company: str) -> str:
+    """Lowercase and strip legal-form suffixes ("Pte Ltd", "Inc", ...)."""
+    words = _words(company)
+    while words and words[-1] in _COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def normalize_location(location: str) -> str:
+    """Keep the most specific part of a location ("Singapore, SG" -> "singapore")."""
+    return " ".join(_words((location or "").split(",")[0]))
+
+
+def simhash(text: str, shingle_size: int = 3) -> Optional[int]:
+    """64-bit SimHash over word shingles; None if the text is too short."""
+    words = _words(text)
+    if len(words) < _MIN_FINGERPRINT_WORDS:
+        return None
+
+    weights = [0] * _FINGERPRINT_BITS
+    for i in range(len(words) - shingle_size + 1):
+        shingle = " ".join(words[i:i + shingle_size]).encode("utf-8")
+        value = int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), "big")
+        for bit in range(_FINGERPRINT_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def _title_similarity(a: str, b: str) -> float:
+    """Jaccard similarity of two normalized titles' words."""
+    words_a, words_b = set(a.split()), set(b.split())
+    if not words_a or not words_b:
+        return 0.0
+    return len(words_a & words_b) / len(words_a | words_b)
+
+
+class JobDeduplicator:
+    """Streaming deduplicator for job postings from several sources."""
+
+    def __init__(self, max_distance: int = 6, min_title_similarity: float = 0.5):
+        """
+        Args:
+            max_distance: Maximum SimHash bit difference for near duplicates
+                (listing texts are short, so a few edits flip several bits)
+            min_title_similarity: Minimum title word overlap for near duplicates
+        """
+        self.max_distance = max_distance
+        self.min_title_similarity = min_title_similarity
+        self._bands = max_distance + 1
+        self._band_bits = _FINGERPRINT_BITS // self._bands
+        self._kept: List[Dict] = []
+        self._kept_meta: List[Tuple[str, str, Optional[int]]] = []
+        self._seen_ids: Set[Tuple[str, str]] = set()
+        self._by_key: Dict[Tuple[str, str, str], List[int]] = {}
+        self._by_band: Dict[Tuple[int, int], List[int]] = {}
+        self.duplicates = 0
+
+    def add(self, job: Dict) -> bool:
+        """
+        Offer a job to the deduplicator.
+
+        Returns:
+            True if the job is new and should be kept; False if it duplicates
+            a job seen earlier (which then records this job's source)
+        """
+        source = job.get("source", "")
+        job_id = str(job.get("id") or "")
+        if job_id and (source, job_id) in self._seen_ids:
+            self.duplicates += 1
+            return False
+
+        title = normalize_title(job.get("title", ""))
+        company = normalize_company(job.get("company", ""))
+        key = (title, company, normalize_location(job.get("location", "")))
+        fingerprint = simhash(job.get("description") or job.get("summary") or "")
+
+        original = self._find_duplicate(source, key, title, company, fingerprint)
+        if original is not None:
+            self._merge(self._kept[original], job)
+            self.duplicates += 1
+            return False
+
+        index = len(self._kept)
+        self._kept.append(job)
+        self._kept_meta.append((title, company, fingerprint))
+        if job_id:
+            self._seen_ids.add((source, job_id))
+        self._by_key.setdefault(key, []).append(index)
+        if fingerprint is not None:
+            for band in self._band_keys(fingerprint):
+                self._by_band.setdefault(band, []).append(index)
+        return True
+
+    def filter(self, jobs: Iterable[Dict]) -> List[Dict]:
+        """Return the jobs that are not duplicates, in order."""
+        return [job for job in jobs if self.add(job)]
+
+    async def filter_stream(self, jobs: AsyncIterator[Dict]) -> AsyncIterator[Dict]:
+        """Yield non-duplicate jobs from an async stream as they arrive."""
+        async for job in jobs:
+            if self.add(job):
+                yield job
+
+    def _find_duplicate(
+        self,
+        source: str,
+        key: Tuple[str, str, str],
+        title: str,
+        company: str,
+        fingerprint: Optional[int]
+    ) -> Optional[int]:
+        """Index of a kept job from another source that this job duplicates."""
+        for index in self._by_key.get(key, []):
+            if self._kept[index].get("source", "") != source:
+                return index
+
+        if fingerprint is None or not company:
+            return None
+        candidates = set()
+        for band in self._band_keys(fingerprint):
+            candidates.update(self._by_band.get(band, []))
+        for index in sorted(candidates):
+            kept_title, kept_company, kept_fingerprint = self._kept_meta[index]
+            if (
+                self._kept[index].get("source", "") != source
+                and kept_company == company
+                and bin(kept_fingerprint ^ fingerprint).count("1") <= self.max_distance
+                and _title_similarity(kept_title, title) >= self.min_title_similarity
+            ):
+                return index
+        return None
+
+    def _band_keys(self, fingerprint: int) -> List[Tuple[int, int]]:
+        mask = (1 << self._band_bits) - 1
+        return [(band, fingerprint >> (band * self._band_bits) & mask) for band in range(self._bands)]
+
+    @staticmethod
+    def _merge(kept: Dict, duplicate: Dict) -> None:
+        """Record the duplicate's source on the kept job and fill its gaps."""
+        sources = kept.setdefault("sources", [kept.get("source", "")])
+        if duplicate.get("source", "") not in sources:
+            sources.append(duplicate.get("source", ""))
+        for field in ("description", "summary", "description_url", "salary_range", "requirements"):
+            if not kept.get(field) and duplicate.get(field):
+                kept[field] = duplicate[field]
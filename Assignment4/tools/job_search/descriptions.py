@@ -0,0 +1,128 @@
+"""Lazy job description hydration.
+
+Scraped listings come back with a cheap `summary` and a `description_url`
+but no `description`, because most jobs are filtered out before anyone
+reads their full text. Consumers that need the text (e.g. the relevance
+scorer) call `hydrate_descriptions(jobs)` on just the jobs they use; each
+description is fetched once, written into the job and cached by URL so
+repeated searches and concurrent consumers share the result.
+"""
+from typing import Awaitable, Callable, Dict, List
+from collections import OrderedDict
+import asyncio
+
+from tools.http_client import loop_local
+from tools.linkedin_scraper import fetch_job_description
+from tools.web_scraper import fetch_board_description
+
+# Maximum number of descriptions kept in memory
+CACHE_SIZE = 1024
+
+# Maximum number of detail pages fetched at once per hydration call
+HYDRATION_CONCURRENCY = 8
+
+# Seconds allowed for fetching one description
+HYDRATION_TIMEOUT = 10.0
+
+# Fetcher used for each listing source
+_FETCHERS: Dict[str, Callable[[str], Awaitable[str]]] = {
+    "LinkedIn": fetch_job_description,
+    "Indeed": lambda url: fetch_board_description(url, "Indeed"),
+    "Glassdoor": lambda url: fetch_board_description(url, "Glassdoor"),
+}
+
+_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+def needs_hydration(job: Dict) -> bool:
+    """Whether the job's full description has not been resolved yet."""
+    return not job.get("description") and bool(job.get("description_url"))
+
+
+async def hydrate_description(job: Dict) -> str:
+    """
+    Resolve a job's full description, fetching it on first use.
+
+    Falls back to the listing `summary` when the description cannot be
+    fetched, so callers always get usable text.
+
+    Args:
+        job: Job posting; its `description` is filled in place
+
+    Returns:
+        The description text
+    """
+    if not needs_hydration(job):
+        return job.get("description") or job.get("summary", "")
+
+    url = job["description_url"]
+    description = _cache.get(url)
+    if description is None:
+        description = await _fetch_shared(url, job.get("source", ""))
+    else:
+        _cache.move_to_end(url)
+
+    job["description"] = description or job.get("summary", "")
+    return job["description"]
+
+
+async def hydrate_descriptions(
+    jobs: List[Dict],
+    concurrency: int = HYDRATION_CONCURRENCY,
+    timeout: float = HYDRATION_TIMEOUT
+) -> None:
+    """
+    Resolve the descriptions of several jobs concurrently.
+
+    Jobs with no description and nothing to fetch it from get their
+    listing `summary` as description, so every job ends up with text.
+
+    Args:
+        jobs: Job postings; descriptions are filled in place
+        concurrency: Maximum number of pages fetched at once
+        timeout: Seconds allowed per description before falling back to the summary
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def hydrate(job: Dict):
+        async with semaphore:
+            try:
+                await asyncio.wait_for(hydrate_description(job), timeout)
+            except Exception as e:
+                print(f"Error getting job description from {job.get('description_url')}: {e!r}")
+                job["description"] = job.get("summary", "")
+
+    for job in jobs:
+        if not job.get("description") and not job.get("description_url"):
+            job["description"] = job.get("summary", "")
+
+    await asyncio.gather(*(hydrate(job) for job in jobs if needs_hydration(job)))
+
+
+async def _fetch_shared(url: str, source: str) -> str:
+    """Fetch a description, joining an identical fetch already in progress."""
+    # Fetches in progress on this loop, so concurrent readers share one request
+    in_flight: Dict[str, asyncio.Future] = loop_local("descriptions.in_flight", dict)
+    future = in_flight.get(url)
+    if future is None:
+        fetcher = _FETCHERS.get(source)
+        if fetcher is None:
+            return ""
+        future = asyncio.ensure_future(fetcher(url))
+        in_flight[url] = future
+        future.add_done_callback(lambda f: _remember(url, f, in_flight))
+    # Shield so one cancelled reader does not cancel the fetch for the others
+    return await asyncio.shield(future)
+
+
+def _remember(url: str, future: asyncio.Future, in_flight: Dict[str, asyncio.Future]) -> None:
+    """Cache a finished fetch and drop it from the in-flight table."""
+    in_flight.pop(url, None)
+    if future.cancelled() or future.exception() is not None:
+        return
+    description = future.result()
+    if description:
+        _cache[url] = description
+        _cache.move_to_end(url)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
@@ -0,0 +1,240 @@
+"""Cheap deterministic job scoring used before the LLM scorer.
+
+`prescore_jobs` gives every job a provisional `JobScore` from local
+signals only:
+
+- skill_score: share of the job's skills the candidate has (the job's
+  `requirements`, or the resume skills mentioned in the job text)
+- experience_score: how well the seniority implied by the title (or an
+  "N+ years" requirement) fits the candidate's years of experience
+- qualitative_score: TF-IDF cosine similarity of job text and resume,
+  a stand-in until the LLM's assessment replaces it (`with_qualitative`)
+- location match against the preferred location ("Remote" always fits)
+
+It takes milliseconds for hundreds of jobs, so it ranks the full result
+list and the LLM only needs to look at the best candidates
+(`top_candidates`).
+
+`resume_data` may be the parsed `ResumeData` dict or raw resume text.
+"""
+from typing import Dict, Iterable, List, Optional, Set
+from collections import Counter
+from datetime import date
+import math
+import re
+
+from state import JobScore
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+_YEAR_RE = re.compile(r"(?:19|20)\d{2}")
+_YEARS_OF_EXPERIENCE_RE = re.compile(r"(\d{1,2})\s*\+?\s*(?:years?|yrs?)")
+
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is",
+    "it", "of", "on", "or", "our", "that", "the", "to", "we", "will", "with",
+    "you", "your", "this", "have", "has", "who", "their", "they",
+}
+
+# Seniority levels: 0 junior, 1 mid, 2 senior, 3 lead
+_TITLE_LEVELS = [
+    (3, {"lead", "principal", "staff", "head", "manager", "director", "architect"}),
+    (2, {"senior", "sr", "snr"}),
+    (0, {"junior", "jr", "intern", "internship", "graduate", "entry", "trainee"}),
+]
+
+# Upper bound (exclusive) on years of experience for each level
+_LEVEL_YEARS = [2, 5, 8]
+
+# Weights of the provisional total score
+SKILL_WEIGHT = 0.4
+EXPERIENCE_WEIGHT = 0.2
+TEXT_WEIGHT = 0.3
+LOCATION_WEIGHT = 0.1
+
+
+def _words(text: str) -> List[str]:
+    return [word for word in _WORD_RE.findall((text or "").lower()) if word not in _STOPWORDS]
+
+
+def _mentions(text: str, phrase: str) -> bool:
+    """Whether `phrase` appears in `text` as whole words (case-insensitive)."""
+    pattern = r"(?<![a-z0-9+#])" + re.escape(phrase.lower()) + r"(?![a-z0-9+#])"
+    return re.search(pattern, text) is not None
+
+
+def _flatten(value) -> str:
+    """Join all strings in a nested dict/list structure."""
+    if isinstance(value, dict):
+        return " ".join(_flatten(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return " ".join(_flatten(item) for item in value)
+    return str(value) if value is not None else ""
+
+
+def _job_text(job: Dict) -> str:
+    return " ".join([
+        job.get("title", ""),
+        job.get("description") or job.get("summary") or "",
+        " ".join(job.get("requirements") or []),
+    ])
+
+
+def _resume_skills(resume_data) -> Set[str]:
+    if isinstance(resume_data, dict):
+        return {skill.strip().lower() for skill in resume_data.get("skills") or [] if skill and skill.strip()}
+    return set()
+
+
+def _skill_score(job: Dict, job_text: str, skills: Set[str], resume_text: str) -> float:
+    requirements = [req.strip().lower() for req in job.get("requirements") or [] if req and req.strip()]
+    if requirements:
+        have = sum(1 for req in requirements if req in skills or _mentions(resume_text, req))
+        return have / len(requirements)
+    if skills:
+        # No structured requirements: count resume skills the job text asks for
+        mentioned = sum(1 for skill in skills if _mentions(job_text, skill))
+        return min(1.0, mentioned / min(len(skills), 5))
+    return 0.0
+
+
+def _candidate_years(resume_data) -> Optional[float]:
+    """Years of work experience from the resume, if they can be told."""
+    if isinstance(resume_data, dict):
+        total = 0.0
+        for role in resume_data.get("experience") or []:
+            start = _YEAR_RE.search(str(role.get("start_date") or ""))
+            if not start:
+                continue
+            end = _YEAR_RE.search(str(role.get("end_date") or ""))
+            end_year = int(end.group()) if end else date.today().year
+            total += max(0, end_year - int(start.group()))
+        if total:
+            return total
+    stated = [int(years) for years in _YEARS_OF_EXPERIENCE_RE.findall(_flatten(resume_data).lower())]
+    return float(max(stated)) if stated else None
+
+
+def _job_level(job: Dict) -> int:
+    title = set(_WORD_RE.findall(job.get("title", "").lower()))
+    for level, words in _TITLE_LEVELS:
+        if title & words:
+            return level
+    required = _YEARS_OF_EXPERIENCE_RE.findall((job.get("description") or job.get("summary") or "").lower())
+    if required:
+        return _years_level(max(int(years) for years in required))
+    return 1
+
+
+def _years_level(years: float) -> int:
+    return sum(1 for bound in _LEVEL_YEARS if years >= bound)
+
+
+def _experience_score(job: Dict, candidate_years: Optional[float]) -> float:
+    if candidate_years is None:
+        return 0.5
+    gap = _job_level(job) - _years_level(candidate_years)
+    # Reaching up a level hurts more than being overqualified
+    return max(0.0, 1.0 - (0.35 * gap if gap > 0 else 0.2 * -gap))
+
+
+def _location_score(job: Dict, location: Optional[str]) -> float:
+    if not location:
+        return 0.5
+    job_location = (job.get("location") or "").lower()
+    if "remote" in job_location or location.lower() in job_location:
+        return 1.0
+    return 0.0
+
+
+def _tfidf_similarities(resume_text: str, job_texts: List[str]) -> List[float]:
+    """Cosine similarity of each job text to the resume, with IDF over all texts."""
+    documents = [Counter(_words(text)) for text in [resume_text] + job_texts]
+    document_frequency = Counter(term for document in documents for term in document)
+    count = len(documents)
+    idf = {term: math.log((1 + count) / (1 + df)) + 1 for term, df in document_frequency.items()}
+
+    vectors = []
+    for document in documents:
+        vector = {term: (1 + math.log(tf)) * idf[term] for term, tf in document.items()}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+        vectors.append({term: weight / norm for term, weight in vector.items()})
+
+    resume_vector = vectors[0]
+    return [
+        sum(weight * resume_vector.get(term, 0.0) for term, weight in vector.items())
+        for vector in vectors[1:]
+    ]
+
+
+def prescore_jobs(
+    jobs: List[Dict],
+    resume_data,
+    location: Optional[str] = None
+) -> Dict[str, JobScore]:
+    """
+    Score jobs against a resume without calling the LLM.
+
+    Args:
+        jobs: Job postings (descriptions may still be summaries)
+        resume_data: Parsed `ResumeData` dict or raw resume text
+        location: Preferred job location, if any
+
+    Returns:
+        Provisional scores in [0, 1] keyed by job id, in job order
+    """
+    resume_text = _flatten(resume_data).lower()
+    skills = _resume_skills(resume_data)
+    candidate_years = _candidate_years(resume_data)
+    job_texts = [_job_text(job).lower() for job in jobs]
+    similarities = _tfidf_similarities(resume_text, job_texts)
+
+    scores: Dict[str, JobScore] = {}
+    for job, job_text, similarity in zip(jobs, job_texts, similarities):
+        skill_score = _skill_score(job, job_text, skills, resume_text)
+        experience_score = _experience_score(job, candidate_years)
+        location_score = _location_score(job, location)
+        total = (
+            SKILL_WEIGHT * skill_score
+            + EXPERIENCE_WEIGHT * experience_score
+            + TEXT_WEIGHT * similarity
+            + LOCATION_WEIGHT * location_score
+        )
+        scores[job["id"]] = JobScore(
+            total_score=round(total, 4),
+            skill_score=round(skill_score, 4),
+            experience_score=round(experience_score, 4),
+            qualitative_score=round(similarity, 4),
+            explanation=(
+                f"Provisional: skills {skill_score:.0%}, experience {experience_score:.0%}, "
+                f"text similarity {similarity:.0%}, location {location_score:.0%}"
+            ),
+        )
+    return scores
+
+
+def with_qualitative(provisional: JobScore, qualitative_score: float, explanation: str) -> JobScore:
+    """
+    Replace the text-similarity part of a provisional score with the LLM's assessment.
+
+    The skill and experience scores are kept, and the total is recomputed
+    with the qualitative score in place of the similarity, using the same
+    weights.
+    """
+    total = provisional["total_score"] + TEXT_WEIGHT * (qualitative_score - provisional["qualitative_score"])
+    return JobScore(
+        total_score=round(min(1.0, max(0.0, total)), 4),
+        skill_score=provisional["skill_score"],
+        experience_score=provisional["experience_score"],
+        qualitative_score=round(qualitative_score, 4),
+        explanation=explanation,
+    )
+
+
+def top_candidates(jobs: Iterable[Dict], scores: Dict[str, JobScore], k: int) -> List[Dict]:
+    """The `k` jobs with the highest total score, best first (ties keep job order)."""
+    ranked = sorted(
+        (job for job in jobs if job["id"] in scores),
+        key=lambda job: scores[job["id"]]["total_score"],
+        reverse=True
+    )
+    return ranked[:k]
@@ -0,0 +1,53 @@
+"""Live top-K ranking of jobs whose scores keep changing.
+
+Scores stream in while the user watches (provisional ones first, then the
+LLM's), and a job's score may go up or down. `LiveTopK` keeps every score
+in a max-heap; an update pushes a new entry and leaves the old one behind
+as stale. `top()` pops entries until it has `k` current ones, discarding
+stale entries for good, and pushes the current ones back, so each refresh
+costs O((k + stale) log n) instead of re-sorting all jobs.
+"""
+from typing import Dict, List, Tuple
+import heapq
+import itertools
+
+from state import JobScore
+
+
+class LiveTopK:
+    """The `k` best-scoring jobs, kept up to date as scores change."""
+
+    def __init__(self, k: int = 10):
+        """
+        Args:
+            k: Number of jobs to rank
+        """
+        self.k = k
+        self._heap: List[Tuple[float, int, str]] = []
+        self._scores: Dict[str, JobScore] = {}
+        self._entries: Dict[str, int] = {}
+        self._counter = itertools.count()
+
+    def update(self, job_id: str, score: JobScore) -> None:
+        """Set a job's score (replacing any earlier one)."""
+        entry = next(self._counter)
+        self._scores[job_id] = score
+        self._entries[job_id] = entry
+        heapq.heappush(self._heap, (-score["total_score"], entry, job_id))
+
+    def top(self) -> List[Tuple[str, JobScore]]:
+        """The best `k` jobs with their scores, best first (earlier updates win ties)."""
+        current = []
+        while self._heap and len(current) < self.k:
+            item = heapq.heappop(self._heap)
+            if self._entries.get(item[2]) == item[1]:
+                current.append(item)
+        for item in current:
+            heapq.heappush(self._heap, item)
+        return [(job_id, self._scores[job_id]) for _, _, job_id in current]
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._scores
@@ -0,0 +1,113 @@
+"""Persistent cache of LLM relevance scores.
+
+A score depends only on the resume, the job and how it was scored, so it
+is stored under a hash of
+
+- the normalized resume data,
+- the job's content (title, company, location, listing text, requirements), and
+- the model name and scoring prompt version.
+
+Re-scoring after a refreshed search, or in a later session, then only pays
+for jobs that are genuinely new. Editing the resume, a changed posting or a
+new prompt version all produce new keys, so stale scores are never reused.
+
+Settings come from environment variables (or `.env`):
+
+    JOBCONNECT_SCORE_CACHE_PATH         SQLite file (default ~/.cache/jobconnect/cache.sqlite3)
+    JOBCONNECT_SCORE_CACHE_TTL          seconds a score stays valid (default 7 days)
+    JOBCONNECT_SCORE_CACHE_MAX_ENTRIES  scores kept (default 10000)
+"""
+from typing import Dict, Iterable, Mapping, Optional
+import hashlib
+import json
+import os
+
+from state import JobScore
+from tools.config import env_number
+from tools.sqlite_store import SQLiteStore, default_cache_path
+
+
+def _digest(value) -> str:
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _normalized(value):
+    """Copy of a resume value with every string lowercased and its whitespace collapsed."""
+    if isinstance(value, str):
+        return " ".join(value.lower().split())
+    if isinstance(value, dict):
+        return {key: _normalized(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalized(item) for item in value]
+    return value
+
+
+def resume_fingerprint(resume_data) -> str:
+    """Hash of the resume (text or parsed data), ignoring key order, case and whitespace differences."""
+    return _digest(_normalized(resume_data))
+
+
+def job_fingerprint(job: Dict) -> str:
+    """
+    Hash of a job's content.
+
+    The listing text is the summary when there is one, so the fingerprint
+    is the same before and after the full description is hydrated.
+    """
+    return _digest([
+        " ".join((job.get(field) or "").lower().split())
+        for field in ("title", "company", "location")
+    ] + [
+        " ".join((job.get("summary") or job.get("description") or "").split()),
+        sorted(job.get("requirements") or []),
+    ])
+
+
+class ScoreCache:
+    """Scores keyed by (resume, job, model/prompt version)."""
+
+    def __init__(self, store: SQLiteStore):
+        self.store = store
+
+    @staticmethod
+    def key(resume_fp: str, job: Dict, version: str) -> str:
+        """Cache key for one job scored against a resume."""
+        return _digest([resume_fp, job_fingerprint(job), version])
+
+    def lookup(self, resume_data, jobs: Iterable[Dict], version: str) -> Dict[str, JobScore]:
+        """Cached scores keyed by job id, for the jobs that have one."""
+        resume_fp = resume_fingerprint(resume_data)
+        keys = {self.key(resume_fp, job, version): job["id"] for job in jobs}
+        return {keys[key]: JobScore(**score) for key, score in self.store.get_many(keys).items()}
+
+    def store_scores(
+        self,
+        resume_data,
+        jobs: Iterable[Dict],
+        scores: Mapping[str, JobScore],
+        version: str
+    ) -> None:
+        """Save the scores of the given jobs (jobs without a score are skipped)."""
+        resume_fp = resume_fingerprint(resume_data)
+        self.store.set_many({
+            self.key(resume_fp, job, version): dict(scores[job["id"]])
+            for job in jobs
+            if job["id"] in scores
+        })
+
+
+_cache: Optional[ScoreCache] = None
+
+
+def get_score_cache() -> ScoreCache:
+    """Return the process-wide score cache configured from the environment."""
+    global _cache
+    if _cache is None:
+        _cache = ScoreCache(SQLiteStore(
+            os.getenv("JOBCONNECT_SCORE_CACHE_PATH") or default_cache_path("cache.sqlite3"),
+            table="job_scores",
+            ttl=env_number("JOBCONNECT_SCORE_CACHE_TTL", 7 * 24 * 3600),
+            max_entries=int(env_number("JOBCONNECT_SCORE_CACHE_MAX_ENTRIES", 10000)),
+        ))
+    return _cache
@@ -0,0 +1,233 @@
+"""Job sources behind one streaming interface.
+
+Every source implements the `JobSource` protocol: it has a `name` and a
+`search(criteria)` method that yields normalized `JobPosting` records as
+an async iterator. Sources are registered by name with `register_source`,
+and `merge_job_streams` runs several of them concurrently and yields
+their jobs in arrival order. A bounded queue provides backpressure, so a
+fast source pauses while the consumer falls behind.
+
+The criteria dict is the one the scrapers already take:
+
+    keywords          list of search terms
+    location          desired job location
+    experience_level  required experience level
+    job_type          Full-time, Part-time, etc.
+"""
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional, Protocol, runtime_checkable
+import asyncio
+import hashlib
+
+from state import JobPosting
+from tools.linkedin_scraper import search_linkedin_jobs
+from tools.web_scraper import MAX_PAGES, MAX_RESULTS_PER_BOARD, stream_job_boards
+from tools.mock_job_platform import MockJobPlatformAPI
+
+# Seconds each source may take before it stops contributing
+SOURCE_TIMEOUT = 30.0
+
+# Jobs buffered between the sources and the consumer
+MAX_BUFFERED_JOBS = 64
+
+
+@runtime_checkable
+class JobSource(Protocol):
+    """A searchable source of job postings."""
+
+    name: str
+
+    def search(self, criteria: Dict) -> AsyncIterator[JobPosting]:
+        """Yield job postings matching the criteria as they are found."""
+        ...
+
+
+def normalize_posting(job: Dict, source: str) -> JobPosting:
+    """
+    Fill in the `JobPosting` fields a source left out.
+
+    Extra fields (e.g. `summary`, `description_url`) are kept. An empty
+    description stays empty so it can still be hydrated lazily. A posting
+    without an id gets one derived from its source and content, so it is
+    stable across searches and distinct from other id-less postings.
+    """
+    posting = dict(job)
+    for field in ("title", "company", "location", "posting_date"):
+        posting[field] = (posting.get(field) or "").strip()
+    posting["description"] = posting.get("description") or ""
+    posting["requirements"] = list(posting.get("requirements") or [])
+    posting.setdefault("salary_range", None)
+    posting["source"] = posting.get("source") or source
+    posting["id"] = str(posting.get("id") or _generated_id(posting))
+    return posting
+
+
+def _generated_id(posting: Dict) -> str:
+    """Stable id from the posting's source and its URL (or title, company and location)."""
+    content = posting.get("description_url") or "\x1f".join(
+        posting[field].lower() for field in ("title", "company", "location")
+    )
+    digest = hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+    return f"{posting['source']}-{digest}"
+
+
+class LinkedInSource:
+    """LinkedIn search through the pooled headless browser."""
+
+    name = "LinkedIn"
+
+    async def search(self, criteria: Dict) -> AsyncIterator[JobPosting]:
+        for job in await search_linkedin_jobs(criteria):
+            yield normalize_posting(job, self.name)
+
+
+class JobBoardSource:
+    """Indeed and Glassdoor result pages, crawled concurrently."""
+
+    name = "JobBoards"
+
+    def __init__(self, max_pages: int = MAX_PAGES, max_results: int = MAX_RESULTS_PER_BOARD):
+        """
+        Args:
+            max_pages: Maximum number of result pages per board
+            max_results: Maximum number of jobs per board
+        """
+        self.max_pages = max_pages
+        self.max_results = max_results
+
+    async def search(self, criteria: Dict) -> AsyncIterator[JobPosting]:
+        async for job in stream_job_boards(criteria, self.max_pages, self.max_results):
+            yield normalize_posting(job, job.get("source", self.name))
+
+
+class JobPlatformSource:
+    """The job platform API, read page by page."""
+
+    name = "MockJobPlatform"
+
+    def __init__(
+        self,
+        platform: Optional[MockJobPlatformAPI] = None,
+        max_results: int = 50,
+        page_size: int = 20
+    ):
+        """
+        Args:
+            platform: API client to search (default: a new generated corpus)
+            max_results: Maximum number of jobs to yield
+            page_size: Jobs fetched per page
+        """
+        self.platform = platform or MockJobPlatformAPI()
+        self.max_results = max_results
+        self.page_size = page_size
+
+    async def search(self, criteria: Dict) -> AsyncIterator[JobPosting]:
+        found = 0
+        results = self.platform.iter_search_results(
+            " ".join(criteria.get("keywords", [])),
+            location=criteria.get("location"),
+            page_size=self.page_size,
+            match_all=False
+        )
+        async for job in results:
+            if found >= self.max_results:
+                break
+            # normalize_posting copies, so annotations don't leak into the corpus
+            yield normalize_posting(job, self.name)
+            found += 1
+
+
+_registry: Dict[str, Callable[[], JobSource]] = {}
+
+
+def register_source(name: str, factory: Callable[[], JobSource]) -> None:
+    """
+    Register a job source (replaces any source of the same name).
+
+    Args:
+        name: Name used to select the source
+        factory: Creates the source when a searcher is set up
+    """
+    _registry[name] = factory
+
+
+def available_sources() -> List[str]:
+    """Names of the registered sources, in registration order."""
+    return list(_registry)
+
+
+def create_sources(names: Optional[Iterable[str]] = None) -> List[JobSource]:
+    """
+    Instantiate registered sources.
+
+    Args:
+        names: Sources to create (default: all registered sources)
+
+    Raises:
+        KeyError: If a name is not registered
+    """
+    return [_registry[name]() for name in (names if names is not None else _registry)]
+
+
+register_source(LinkedInSource.name, LinkedInSource)
+register_source(JobBoardSource.name, JobBoardSource)
+register_source(JobPlatformSource.name, JobPlatformSource)
+
+
+async def merge_job_streams(
+    sources: List[JobSource],
+    criteria: Dict,
+    timeout: float = SOURCE_TIMEOUT,
+    status: Optional[Dict[str, str]] = None,
+    max_buffered: int = MAX_BUFFERED_JOBS
+) -> AsyncIterator[JobPosting]:
+    """
+    Search several sources concurrently and yield jobs as they arrive.
+
+    A source that exceeds `timeout` stops contributing, but jobs it already
+    produced are kept. Closing the iterator early cancels the searches.
+
+    Args:
+        sources: Sources to search
+        criteria: Search parameters passed to every source
+        timeout: Seconds each source may take
+        status: Optional dict that receives each source's outcome:
+            "ok", "timeout" or "error" (sources still running when the
+            iterator is closed are left as "timeout")
+        max_buffered: Jobs buffered before sources are paused
+
+    Yields:
+        Job postings from all sources, in arrival order
+    """
+    status = status if status is not None else {}
+    queue: asyncio.Queue = asyncio.Queue(max_buffered)
+    done = object()
+
+    async def pump(source: JobSource):
+        async for job in source.search(criteria):
+            await queue.put(job)
+
+    async def produce(source: JobSource):
+        status[source.name] = "timeout"
+        try:
+            await asyncio.wait_for(pump(source), timeout)
+            status[source.name] = "ok"
+        except asyncio.TimeoutError:
+            print(f"{source.name} search timed out after {timeout:g}s")
+        except Exception as e:
+            print(f"Error searching {source.name}: {e}")
+            status[source.name] = "error"
+        # Not in a `finally`: a cancelled producer must not block on a full queue
+        await queue.put(done)
+
+    producers = [asyncio.ensure_future(produce(source)) for source in sources]
+    try:
+        remaining = len(producers)
+        while remaining:
+            item = await queue.get()
+            if item is done:
+                remaining -= 1
+            else:
+                yield item
+    finally:
+        for producer in producers:
+            producer.cancel()
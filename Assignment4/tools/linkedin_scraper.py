@@ -1,13 +1,30 @@
 """LinkedIn job search tool using Selenium for web scraping."""
-from typing import Dict, List
-from selenium import webdriver
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import lxml.html
+from lxml import etree
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-import json
+from tools.http_client import get_http_client
+from tools.rate_limiter import request_with_retries
+from tools.webdriver_pool import get_webdriver_pool
 
-async def search_linkedin_jobs(search_criteria: Dict) -> List[Dict]:
+# Maximum number of job detail pages fetched at once per search
+DESCRIPTION_CONCURRENCY = 8
+
+# Seconds allowed for fetching one job description
+DESCRIPTION_TIMEOUT = 10.0
+
+# Description containers on the public job page, most specific first
+_DESCRIPTION_XPATHS = [
+    etree.XPath(f".//div[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]")
+    for class_name in ("show-more-less-html__markup", "description__text", "jobs-description")
+]
+
+async def search_linkedin_jobs(search_criteria: Dict, fetch_descriptions: bool = False) -> List[Dict]:
     """
     Search LinkedIn for jobs matching the given criteria.
     
@@ -17,51 +34,129 @@ async def search_linkedin_jobs(search_criteria: Dict) -> List[Dict]:
             - location: Desired job location
             - experience_level: Required experience level
             - job_type: Full-time, Part-time, etc.
+        fetch_descriptions: Fetch every full description now instead of
+            leaving them to be resolved lazily from `description_url`
     
     Returns:
-        List of job postings with details
+        List of job postings with a `summary` of the card text
     """
-    # Initialize webdriver (you'll need to set up proper webdriver configuration)
-    driver = webdriver.Chrome()
-    
-    try:
-        # Construct search URL
-        base_url = "https://www.linkedin.com/jobs/search/?"
-        params = {
-            "keywords": " ".join(search_criteria.get("keywords", [])),
-            "location": search_criteria.get("location", ""),
-            "f_E": search_criteria.get("experience_level", ""),
-            "f_JT": search_criteria.get("job_type", "")
-        }
+    # Lease a warm headless browser; selenium calls block, so run them in a thread
+    async with get_webdriver_pool().lease() as driver:
+        cards = await asyncio.to_thread(_scrape_search_results, driver, search_criteria)
+        jobs = [job for job, _ in cards]
+        if not fetch_descriptions:
+            return jobs
         
-        # Navigate to search results
-        search_url = base_url + "&".join([f"{k}={v}" for k, v in params.items() if v])
-        driver.get(search_url)
-        
-        # Wait for job listings to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "jobs-search__results-list"))
-        )
+        # Fetch all descriptions concurrently from the job detail pages
+        descriptions = await fetch_job_descriptions([job["description_url"] for job in jobs])
+        for job, description in zip(jobs, descriptions):
+            job["description"] = description
         
-        # Extract job listings
-        jobs = []
-        job_cards = driver.find_elements(By.CLASS_NAME, "job-card-container")
-        
-        for card in job_cards:
-            job = {
-                "id": card.get_attribute("data-job-id"),
-                "title": card.find_element(By.CLASS_NAME, "job-card-list__title").text,
-                "company": card.find_element(By.CLASS_NAME, "job-card-container__company-name").text,
-                "location": card.find_element(By.CLASS_NAME, "job-card-container__metadata-item").text,
-                "link": card.find_element(By.CLASS_NAME, "job-card-list__title").get_attribute("href"),
-                "description": get_job_description(driver, card)
-            }
-            jobs.append(job)
+        # Fall back to clicking through the cards whose page could not be fetched
+        missing = [(job, card) for job, card in cards if not job["description"]]
+        if missing:
+            await asyncio.to_thread(_describe_by_clicking, driver, missing)
         
         return jobs
+
+def _scrape_search_results(driver, search_criteria: Dict) -> List[Tuple[Dict, WebElement]]:
+    """Run a LinkedIn search in the given browser and extract the job cards.
+
+    Returns (job, card element) pairs; descriptions are left unset.
+    """
+    # Construct search URL
+    base_url = "https://www.linkedin.com/jobs/search/?"
+    params = {
+        "keywords": " ".join(search_criteria.get("keywords", [])),
+        "location": search_criteria.get("location", ""),
+        "f_E": search_criteria.get("experience_level", ""),
+        "f_JT": search_criteria.get("job_type", "")
+    }
+    
+    # Navigate to search results
+    search_url = base_url + "&".join([f"{k}={v}" for k, v in params.items() if v])
+    driver.get(search_url)
+    
+    # Wait for job listings to load
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.CLASS_NAME, "jobs-search__results-list"))
+    )
+    
+    # Extract job listings
+    cards = []
+    job_cards = driver.find_elements(By.CLASS_NAME, "job-card-container")
     
-    finally:
-        driver.quit()
+    for card in job_cards:
+        job = {
+            "id": card.get_attribute("data-job-id"),
+            "title": card.find_element(By.CLASS_NAME, "job-card-list__title").text,
+            "company": card.find_element(By.CLASS_NAME, "job-card-container__company-name").text,
+            "location": card.find_element(By.CLASS_NAME, "job-card-container__metadata-item").text,
+            "link": card.find_element(By.CLASS_NAME, "job-card-list__title").get_attribute("href"),
+            "summary": card.text,
+            "description": None,
+            "source": "LinkedIn"
+        }
+        job["description_url"] = job["link"]
+        cards.append((job, card))
+    
+    return cards
+
+def _describe_by_clicking(driver, cards: List[Tuple[Dict, WebElement]]) -> None:
+    """Fill in descriptions by opening each card in the browser (slow path)."""
+    for job, card in cards:
+        job["description"] = get_job_description(driver, card)
+
+async def fetch_job_descriptions(
+    urls: List[Optional[str]],
+    concurrency: int = DESCRIPTION_CONCURRENCY,
+    timeout: float = DESCRIPTION_TIMEOUT
+) -> List[str]:
+    """
+    Fetch job descriptions from their detail pages concurrently.
+    
+    Args:
+        urls: Job detail page URLs (None entries are skipped)
+        concurrency: Maximum number of pages fetched at once
+        timeout: Seconds allowed per page
+    
+    Returns:
+        Descriptions in the same order as `urls`; "" where fetching failed
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def fetch(url: Optional[str]) -> str:
+        if not url:
+            return ""
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(fetch_job_description(url), timeout)
+            except asyncio.TimeoutError:
+                print(f"Timed out getting job description from {url}")
+            except Exception as e:
+                print(f"Error getting job description from {url}: {e}")
+            return ""
+    
+    return list(await asyncio.gather(*(fetch(url) for url in urls)))
+
+async def fetch_job_description(url: str) -> str:
+    """Fetch one job detail page on the shared HTTP client and extract its description."""
+    response = await request_with_retries(get_http_client(), "GET", url)
+    if response.status_code != 200:
+        print(f"Error {response.status_code} getting job description from {url}")
+        return ""
+    return await asyncio.to_thread(extract_job_description, response.text)
+
+def extract_job_description(html: str) -> str:
+    """Extract the description text from a LinkedIn job detail page."""
+    if not html.strip():
+        return ""
+    root = lxml.html.fromstring(html)
+    for xpath in _DESCRIPTION_XPATHS:
+        matches = xpath(root)
+        if matches:
+            return matches[0].text_content().strip()
+    return ""
 
 def get_job_description(driver, job_card) -> str:
     """Click on job card and extract full description."""
@@ -1,64 +1,176 @@
 """Mock Job Platform API client."""
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Set
+from array import array
+from collections import Counter, OrderedDict
+import base64
+import heapq
+import itertools
+import json
+import math
+import os
 import random
-from datetime import datetime, timedelta
+import re
+import uuid
+from datetime import date, datetime, timedelta
 
-class MockJobPlatformAPI:
-    """Mock API client for a job platform."""
+from tools.job_corpus import JobCorpus, write_snapshot
+
+# Tokens keep the punctuation that is meaningful in skill names
+# ("node.js", "c++", "c#") and drop everything else.
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split text into lowercase search tokens."""
+    return [token.rstrip(".") for token in _TOKEN_RE.findall(text.lower())]
+
+
+# BM25 parameters (standard Okapi defaults)
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+# Title tokens are counted this many times so title hits outrank
+# incidental mentions in the description.
+_TITLE_WEIGHT = 2
+
+# Number of ranked result sets kept around for cursor pagination
+_MAX_RESULT_SETS = 128
+
+# Corpus positions kept across all of those result sets (4 bytes each); the
+# least recently used sets are evicted first, the newest one is always kept
+_MAX_RESULT_POSITIONS = 4_000_000
+
+
+# Synthetic corpus vocabulary. Each role lists the skills it typically asks
+# for, most common first; skills are drawn with Zipf-like weights so popular
+# skills dominate the corpus the way they do on real job boards.
+_ROLE_SKILLS = {
+    "Software Engineer": ["Python", "Java", "SQL", "Git", "Docker", "Go", "REST", "Microservices"],
+    "Data Scientist": ["Python", "SQL", "Pandas", "Scikit-learn", "Statistics", "TensorFlow", "PyTorch", "Spark"],
+    "Product Manager": ["Agile", "Scrum", "SQL", "Jira", "Analytics", "Roadmapping"],
+    "DevOps Engineer": ["AWS", "Docker", "Kubernetes", "Terraform", "Linux", "Python", "Ansible", "Jenkins"],
+    "Full Stack Developer": ["JavaScript", "React", "Node.js", "TypeScript", "SQL", "HTML", "CSS", "Docker"],
+    "AI Engineer": ["Python", "PyTorch", "TensorFlow", "LLMs", "LangChain", "Docker", "AWS"],
+    "Cloud Architect": ["AWS", "Azure", "GCP", "Kubernetes", "Terraform", "Networking", "Security"],
+    "Machine Learning Engineer": ["Python", "PyTorch", "TensorFlow", "Scikit-learn", "Spark", "Kubernetes", "MLOps"],
+}
+_ROLE_WEIGHTS = [30, 12, 8, 10, 14, 8, 6, 12]
+
+# Skills any role may additionally list, most common first
+_GENERAL_SKILLS = [
+    "Python", "SQL", "Java", "JavaScript", "AWS", "Docker", "Git", "Linux",
+    "Kubernetes", "React", "Node.js", "Azure", "GCP", "Go", "Rust", "C++",
+    "Kafka", "Redis", "PostgreSQL", "MongoDB", "GraphQL", "Airflow",
+]
+
+_SENIORITY = [("Junior ", 0.7), ("", 1.0), ("Senior ", 1.4), ("Lead ", 1.7)]
+_SENIORITY_WEIGHTS = [15, 45, 30, 10]
+
+_COMPANY_PREFIXES = [
+    "Tech", "Data", "Cloud", "AI", "DevPro", "Innovate", "Quantum", "Blue",
+    "Nova", "Apex", "Lion", "Merlion",
+]
+_COMPANY_SUFFIXES = ["Corp", "Labs", "Scale", "Future", "Works", "SG", "Systems", "Analytics"]
+
+_LOCATIONS = ["Singapore", "Remote", "Kuala Lumpur", "Jakarta", "Hong Kong", "Sydney"]
+_LOCATION_WEIGHTS = [50, 25, 8, 7, 6, 4]
+
+
+def _zipf_cum_weights(size: int, exponent: float = 1.0) -> List[float]:
+    """Cumulative Zipf weights for a population of the given size."""
+    total = 0.0
+    cumulative = []
+    for rank in range(1, size + 1):
+        total += 1.0 / rank ** exponent
+        cumulative.append(total)
+    return cumulative
+
+
+def _weighted_sample(rng: random.Random, population: List[str], cum_weights: List[float], k: int) -> List[str]:
+    """Draw `k` distinct items using cumulative weights."""
+    k = min(k, len(population))
+    picked: List[str] = []
+    while len(picked) < k:
+        for item in rng.choices(population, cum_weights=cum_weights, k=k - len(picked)):
+            if item not in picked:
+                picked.append(item)
+    return picked
+
+
+def iter_mock_jobs(
+    count: int = 50,
+    seed: Optional[int] = None,
+    reference_date: Optional[date] = None
+) -> Iterator[Dict]:
+    """
+    Lazily generate synthetic job postings.
     
-    def __init__(self):
-        self._jobs_db = self._initialize_mock_jobs()
+    Roles, seniority, companies and locations follow skewed distributions and
+    each role draws most of its requirements from its own skill profile, so
+    large corpora have realistic posting-list sizes for benchmarking.
     
-    def _initialize_mock_jobs(self) -> List[Dict]:
-        """Initialize mock job database."""
-        job_titles = [
-            "Software Engineer", "Data Scientist", "Product Manager",
-            "DevOps Engineer", "Full Stack Developer", "AI Engineer",
-            "Cloud Architect", "Machine Learning Engineer"
-        ]
+    Args:
+        count: Number of jobs to generate
+        seed: Seed for the random generator; the same seed and reference date
+            always produce the same corpus
+        reference_date: Date the posting dates count back from (default today)
         
-        companies = [
-            "TechCorp", "DataInnovate", "CloudScale",
-            "AIFuture", "DevPro Solutions", "InnovateSG"
-        ]
+    Yields:
+        Job postings
+    """
+    rng = random.Random(seed)
+    reference_date = reference_date or datetime.now().date()
+
+    roles = list(_ROLE_SKILLS)
+    role_skill_weights = {role: _zipf_cum_weights(len(skills)) for role, skills in _ROLE_SKILLS.items()}
+    general_weights = _zipf_cum_weights(len(_GENERAL_SKILLS))
+    companies = [prefix + suffix for prefix in _COMPANY_PREFIXES for suffix in _COMPANY_SUFFIXES]
+    company_weights = _zipf_cum_weights(len(companies), exponent=0.8)
+    
+    for i in range(count):
+        role = rng.choices(roles, weights=_ROLE_WEIGHTS)[0]
+        prefix, salary_factor = rng.choices(_SENIORITY, weights=_SENIORITY_WEIGHTS)[0]
+
+        # Random posting date within last 30 days
+        posting_date = reference_date - timedelta(days=rng.randint(0, 30))
         
-        locations = ["Singapore", "Remote"]
+        # Random salary range, scaled by seniority
+        base_salary = int(rng.randint(5, 15) * salary_factor) * 1000
+        max_salary = base_salary + rng.randint(2, 8) * 1000
         
-        skills = [
-            "Python", "Java", "JavaScript", "React", "Node.js",
-            "AWS", "Docker", "Kubernetes", "TensorFlow", "PyTorch"
-        ]
+        # 2-4 skills from the role profile plus 0-2 general skills
+        required_skills = _weighted_sample(
+            rng, _ROLE_SKILLS[role], role_skill_weights[role], rng.randint(2, 4)
+        )
+        for skill in _weighted_sample(rng, _GENERAL_SKILLS, general_weights, rng.randint(0, 2)):
+            if skill not in required_skills:
+                required_skills.append(skill)
         
-        jobs = []
-        for i in range(50):  # Generate 50 mock jobs
-            # Random posting date within last 30 days
-            posting_date = datetime.now() - timedelta(days=random.randint(0, 30))
-            
-            # Random salary range
-            base_salary = random.randint(5, 15) * 1000
-            max_salary = base_salary + random.randint(2, 8) * 1000
-            
-            # Random required skills (3-6 skills)
-            required_skills = random.sample(skills, random.randint(3, 6))
-            
-            job = {
-                "id": f"JOB-{i+1:04d}",
-                "title": random.choice(job_titles),
-                "company": random.choice(companies),
-                "location": random.choice(locations),
-                "description": self._generate_description(required_skills),
-                "requirements": required_skills,
-                "salary_range": f"${base_salary:,} - ${max_salary:,}",
-                "posting_date": posting_date.strftime("%Y-%m-%d"),
-                "source": "MockJobPlatform"
-            }
-            jobs.append(job)
-        
-        return jobs
-    
-    def _generate_description(self, required_skills: List[str]) -> str:
-        """Generate a mock job description."""
-        return f"""
+        yield {
+            "id": f"JOB-{i+1:04d}",
+            "title": prefix + role,
+            "company": rng.choices(companies, cum_weights=company_weights)[0],
+            "location": rng.choices(_LOCATIONS, weights=_LOCATION_WEIGHTS)[0],
+            "description": _generate_description(required_skills),
+            "requirements": required_skills,
+            "salary_range": f"${base_salary:,} - ${max_salary:,}",
+            "posting_date": posting_date.strftime("%Y-%m-%d"),
+            "source": "MockJobPlatform"
+        }
+
+
+def generate_mock_jobs(
+    count: int = 50,
+    seed: Optional[int] = None,
+    reference_date: Optional[date] = None
+) -> List[Dict]:
+    """Generate synthetic job postings as a list (see `iter_mock_jobs`)."""
+    return list(iter_mock_jobs(count, seed=seed, reference_date=reference_date))
+
+
+def _generate_description(required_skills: List[str]) -> str:
+    """Generate a mock job description."""
+    return f"""
 We are looking for a talented professional to join our team.
 
 Required Skills:
@@ -77,51 +189,410 @@ Benefits:
 - Health insurance
 """
 
+
+class MockJobPlatformAPI:
+    """Mock API client for a job platform."""
+    
+    def __init__(
+        self,
+        snapshot_path: Optional[str] = None,
+        num_jobs: int = 50,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            snapshot_path: Optional corpus snapshot file. If it holds
+                `num_jobs` jobs generated from `seed` they are memory-mapped
+                from it; otherwise (or if it is unreadable) jobs are
+                generated and written there for the next start
+            num_jobs: Number of jobs in the corpus
+            seed: Seed for the job generator (None for a random corpus, in
+                which case any snapshot of `num_jobs` jobs is reused)
+
+        The search index is built from the whole corpus on the first search
+        (several seconds for 100k jobs, as every job is decoded); call
+        `warm_up()` to pay that cost up front instead.
+        """
+        self._jobs_db = None
+        if snapshot_path and os.path.exists(snapshot_path):
+            try:
+                corpus = JobCorpus(snapshot_path)
+            except ValueError as e:
+                # Old format or corrupt; overwrite it below
+                print(f"Cannot use snapshot: {e}; regenerating it")
+                corpus = None
+            if corpus is not None and len(corpus) == num_jobs and (seed is None or corpus.seed == seed):
+                self._jobs_db = corpus
+            elif corpus is not None:
+                print(
+                    f"Snapshot {snapshot_path} holds {len(corpus)} jobs from seed {corpus.seed}, "
+                    f"not {num_jobs} from seed {seed}; regenerating it"
+                )
+                corpus.close()
+        if self._jobs_db is None and snapshot_path:
+            # Stream straight into the snapshot, then map it
+            write_snapshot(iter_mock_jobs(num_jobs, seed=seed), snapshot_path, seed=seed)
+            self._jobs_db = JobCorpus(snapshot_path)
+        elif self._jobs_db is None:
+            self._jobs_db = generate_mock_jobs(num_jobs, seed=seed)
+
+        # Lookup structures are built on first use so that loading a snapshot
+        # stays cheap regardless of corpus size.
+        self._jobs_by_id: Optional[Dict[str, int]] = None
+        self._index: Optional[Dict[str, Dict[int, int]]] = None
+        self._result_sets: "OrderedDict[str, array]" = OrderedDict()
+        self._result_positions = 0
+    
+    def _job_positions(self) -> Dict[str, int]:
+        """Return the job id -> corpus position map, building it if needed."""
+        if self._jobs_by_id is None:
+            if isinstance(self._jobs_db, JobCorpus):
+                ids = self._jobs_db.column("id")
+            else:
+                ids = (job["id"] for job in self._jobs_db)
+            self._jobs_by_id = {job_id: position for position, job_id in enumerate(ids)}
+        return self._jobs_by_id
+    
+    def warm_up(self) -> None:
+        """Build the search index and id lookup now rather than on first use."""
+        if self._index is None:
+            self._build_index()
+        self._job_positions()
+
+    def _build_index(self):
+        """Build the inverted index and pre-normalized fields for searching.
+
+        Every job is tokenized once here (title, description, requirements and
+        location) so that a search only has to intersect posting lists instead
+        of lowercasing and scanning every job. Postings store term frequencies
+        so matches can be ranked with BM25.
+        """
+        index: Dict[str, Dict[int, int]] = {}
+        self._doc_lengths: List[int] = []
+        # Skills and locations are interned into small vocabularies; each job
+        # stores its requirements as a bitmask and its location as an id so
+        # filters become integer compares.
+        self._skill_bits: Dict[str, int] = {}
+        self._skill_masks: List[int] = []
+        self._location_ids: Dict[str, int] = {}
+        self._job_location_ids: List[int] = []
+
+        for position, job in enumerate(self._jobs_db):
+            self._job_location_ids.append(
+                self._location_ids.setdefault(job["location"].lower(), len(self._location_ids))
+            )
+            mask = 0
+            for skill in job["requirements"]:
+                bit = self._skill_bits.setdefault(skill.lower(), len(self._skill_bits))
+                mask |= 1 << bit
+            self._skill_masks.append(mask)
+
+            tokens = _tokenize(job["title"]) * _TITLE_WEIGHT
+            tokens += _tokenize(job["description"])
+            tokens += _tokenize(" ".join(job["requirements"]))
+            tokens += _tokenize(job["location"])
+            self._doc_lengths.append(len(tokens))
+            for token, count in Counter(tokens).items():
+                index.setdefault(token, {})[position] = count
+
+        total_length = sum(self._doc_lengths)
+        self._avg_doc_length = total_length / len(self._doc_lengths) if self._doc_lengths else 0.0
+        # The BM25 length normalisation of each job depends only on its length
+        self._length_norms = [
+            _BM25_K1 * (1 - _BM25_B + _BM25_B * length / self._avg_doc_length)
+            for length in self._doc_lengths
+        ]
+        self._index = index
+
     async def search_jobs(
         self,
         query: str,
         location: Optional[str] = None,
         skills: Optional[List[str]] = None,
-        max_results: int = 10
+        max_results: int = 10,
+        match_all: bool = True
     ) -> List[Dict]:
         """
         Search for jobs based on query and filters.
         
+        Matching is token based: by default every word in the query must
+        appear in the job's title, description, requirements or location
+        (case-insensitive). Results are ranked by BM25 relevance.
+        
         Args:
             query: Search query string
             location: Optional location filter
             skills: Optional list of required skills
             max_results: Maximum number of results to return
+            match_all: Require every query word (False matches any word)
             
         Returns:
-            List of matching job postings
+            List of matching job postings, best match first
+        """
+        positions = self._rank(query, location, skills, match_all, limit=max_results)
+        return [self._jobs_db[position] for position in positions]
+
+    async def search_jobs_page(
+        self,
+        query: str = "",
+        location: Optional[str] = None,
+        skills: Optional[List[str]] = None,
+        page_size: int = 10,
+        cursor: Optional[str] = None,
+        match_all: bool = True
+    ) -> Dict:
         """
-        # Convert query to lowercase for case-insensitive search
-        query = query.lower()
-        matching_jobs = []
+        Fetch one page of ranked search results.
         
-        for job in self._jobs_db:
-            # Check if query matches title or description
-            if query in job["title"].lower() or query in job["description"].lower():
-                # Apply location filter if specified
-                if location and location.lower() != job["location"].lower():
-                    continue
-                    
-                # Apply skills filter if specified
-                if skills:
-                    if not all(skill in job["requirements"] for skill in skills):
-                        continue
-                
-                matching_jobs.append(job)
-                
-                if len(matching_jobs) >= max_results:
-                    break
+        The first call (without a cursor) ranks the full result set once and
+        keeps it server side; following calls pass the returned `next_cursor`
+        and are served from that result set without re-running the query.
+        When a cursor is given, the query and filter arguments are ignored in
+        favour of the ones encoded in the cursor.
         
-        return matching_jobs
+        Args:
+            query: Search query string
+            location: Optional location filter
+            skills: Optional list of required skills
+            page_size: Number of jobs per page
+            cursor: Opaque cursor returned by a previous call
+            match_all: Require every query word (False matches any word)
+            
+        Returns:
+            Dict with the page of `jobs`, the `total` number of matches and a
+            `next_cursor` (None on the last page)
+            
+        Raises:
+            ValueError: If the cursor is malformed or page_size is not positive
+        """
+        if page_size <= 0:
+            raise ValueError(f"page_size must be positive, got {page_size}")
+        if cursor:
+            state = self._decode_cursor(cursor)
+            query, location, skills, match_all = state["q"], state["l"], state["s"], state["m"]
+            result_id, offset = state["r"], state["o"]
+        else:
+            result_id, offset = None, 0
+
+        positions = self._result_sets.get(result_id) if result_id else None
+        if positions is None:
+            # First page, or the result set was evicted: rank (again) and keep it
+            positions = array("I", self._rank(query, location, skills, match_all))
+            result_id = uuid.uuid4().hex
+            self._store_result_set(result_id, positions)
+        else:
+            self._result_sets.move_to_end(result_id)
+
+        end = offset + page_size
+        next_cursor = None
+        if end < len(positions):
+            next_cursor = self._encode_cursor({
+                "r": result_id, "o": end,
+                "q": query, "l": location, "s": skills, "m": match_all,
+            })
+
+        return {
+            "jobs": [self._jobs_db[position] for position in positions[offset:end]],
+            "total": len(positions),
+            "next_cursor": next_cursor,
+        }
+
+    def _store_result_set(self, result_id: str, positions: array) -> None:
+        """Keep a ranked result set for paging, evicting the least recently used ones."""
+        self._result_sets[result_id] = positions
+        self._result_positions += len(positions)
+        while len(self._result_sets) > 1 and (
+            len(self._result_sets) > _MAX_RESULT_SETS
+            or self._result_positions > _MAX_RESULT_POSITIONS
+        ):
+            _, evicted = self._result_sets.popitem(last=False)
+            self._result_positions -= len(evicted)
+
+    async def iter_search_results(
+        self,
+        query: str = "",
+        location: Optional[str] = None,
+        skills: Optional[List[str]] = None,
+        page_size: int = 10,
+        match_all: bool = True
+    ) -> AsyncIterator[Dict]:
+        """Yield ranked matching jobs page by page until the results run out."""
+        cursor = None
+        while True:
+            page = await self.search_jobs_page(
+                query, location, skills, page_size=page_size,
+                cursor=cursor, match_all=match_all
+            )
+            for job in page["jobs"]:
+                yield job
+            cursor = page["next_cursor"]
+            if not cursor:
+                return
+
+    def _rank(
+        self,
+        query: str,
+        location: Optional[str],
+        skills: Optional[List[str]],
+        match_all: bool,
+        limit: Optional[int] = None
+    ) -> List[int]:
+        """Return positions of jobs matching the query and filters, best first.
+
+        Ties (including every job for an empty query) keep corpus order.
+        """
+        if self._index is None:
+            self._build_index()
+
+        tokens = set(_tokenize(query))
+        location_id = self._location_filter(location)
+        required_mask = self._skill_filter(skills)
+        if location_id is None or required_mask is None:
+            # Filter value that no job has
+            return []
+
+        if not tokens:
+            # Every job scores 0, so the ranking is corpus order and the scan
+            # can stop as soon as `limit` jobs pass the filters
+            matches = self._filter(range(len(self._jobs_db)), location_id, required_mask)
+            return list(itertools.islice(matches, limit))
+
+        matches = sorted(self._match_query(tokens, match_all))
+        scores = self._bm25(tokens, self._filter(matches, location_id, required_mask))
+
+        # `scores` is in corpus order and both selections are stable, so
+        # equal scores stay in corpus order
+        if limit is not None:
+            return heapq.nlargest(limit, scores, key=scores.get)
+        return sorted(scores, key=scores.get, reverse=True)
+
+    def _filter(self, positions: Iterable[int], location_id: int, required_mask: int) -> Iterator[int]:
+        """Yield the positions whose job passes the location and skills filters."""
+        if location_id < 0 and not required_mask:
+            return iter(positions)
+        job_location_ids = self._job_location_ids
+        skill_masks = self._skill_masks
+        return (
+            position for position in positions
+            # The job must be in the location and have every required skill bit set
+            if (location_id < 0 or job_location_ids[position] == location_id)
+            and skill_masks[position] & required_mask == required_mask
+        )
+
+    def _location_filter(self, location: Optional[str]) -> Optional[int]:
+        """Map a location filter to its interned id.
+
+        Returns -1 when no filter is set and None for an unknown location.
+        """
+        if not location:
+            return -1
+        return self._location_ids.get(location.lower())
+
+    def _skill_filter(self, skills: Optional[List[str]]) -> Optional[int]:
+        """Build the bitmask of required skills.
+
+        Returns 0 when no filter is set and None if any skill is unknown.
+        """
+        mask = 0
+        for skill in skills or []:
+            bit = self._skill_bits.get(skill.lower())
+            if bit is None:
+                return None
+            mask |= 1 << bit
+        return mask
+
+    def _match_query(self, tokens: set, match_all: bool = True) -> Set[int]:
+        """Resolve query tokens to job positions using the posting lists.
+
+        With `match_all` the posting lists are intersected, otherwise they are
+        unioned.
+        """
+        postings = [self._index.get(token, {}) for token in tokens]
+        if not match_all:
+            matches = set()
+            for posting in postings:
+                matches.update(posting)
+            return matches
+
+        if not all(postings):
+            return set()
+
+        # Intersect starting from the rarest token to keep sets small
+        postings.sort(key=len)
+        matches = set(postings[0])
+        for posting in postings[1:]:
+            matches &= posting.keys()
+            if not matches:
+                break
+        return matches
+
+    def _bm25(self, tokens: set, positions: Iterable[int]) -> Dict[int, float]:
+        """Score jobs against the query tokens with Okapi BM25.
+
+        The idf of each token is computed once per query; scores are then
+        accumulated by walking either the token's posting list or the
+        candidates, whichever is shorter.
+
+        Returns:
+            Scores keyed by position, in the order of `positions`
+        """
+        scores = dict.fromkeys(positions, 0.0)
+        total_docs = len(self._jobs_db)
+        length_norms = self._length_norms
+        for token in tokens:
+            posting = self._index.get(token)
+            if not posting:
+                continue
+            df = len(posting)
+            idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+            weight = idf * (_BM25_K1 + 1)
+            if len(posting) < len(scores):
+                for position, tf in posting.items():
+                    if position in scores:
+                        scores[position] += weight * tf / (tf + length_norms[position])
+            else:
+                tfs = posting.get
+                scores = {
+                    position: score + weight * tf / (tf + length_norms[position])
+                    if (tf := tfs(position)) else score
+                    for position, score in scores.items()
+                }
+        return scores
+
+    @staticmethod
+    def _encode_cursor(state: Dict) -> str:
+        """Pack cursor state into an opaque URL-safe string."""
+        raw = json.dumps(state, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Dict:
+        """Unpack a cursor produced by `_encode_cursor`."""
+        try:
+            state = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            state["o"] = int(state["o"])
+            for key in ("r", "q", "l", "s", "m"):
+                state[key]
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid search cursor: {cursor!r}") from e
+        if state["o"] < 0:
+            raise ValueError(f"Invalid search cursor: {cursor!r}")
+        return state
 
     async def get_job_details(self, job_id: str) -> Optional[Dict]:
         """Get detailed information for a specific job."""
-        for job in self._jobs_db:
-            if job["id"] == job_id:
-                return job
-        return None
\ No newline at end of file
+        position = self._job_positions().get(job_id)
+        return None if position is None else self._jobs_db[position]
+
+    async def get_jobs_details(self, job_ids: List[str]) -> List[Dict]:
+        """
+        Get detailed information for several jobs in one call.
+        
+        Args:
+            job_ids: Job ids to look up
+            
+        Returns:
+            Job postings in the same order as `job_ids`; unknown ids are skipped
+        """
+        positions = self._job_positions()
+        return [self._jobs_db[positions[job_id]] for job_id in job_ids if job_id in positions]
\ No newline at end of file
@@ -0,0 +1,194 @@
+"""Per-host rate limiting and retry with backoff for outbound HTTP requests.
+
+Every request to a host first takes a token from that host's bucket. The
+buckets are shared by all searches in the process, so concurrent searches
+together never exceed a host's rate. Responses with 429 or a 5xx status
+are retried with exponential backoff and full jitter (honouring
+`Retry-After`), and the host's rate is halved; successful responses slowly
+restore it (additive increase, multiplicative decrease).
+
+Defaults come from environment variables (or `.env`):
+
+    JOBCONNECT_RATE_LIMIT_PER_SEC  requests per second per host (default 1.0)
+    JOBCONNECT_RATE_LIMIT_BURST    requests allowed in a burst (default 3)
+"""
+from typing import Dict, Optional
+from email.utils import parsedate_to_datetime
+import asyncio
+import random
+import threading
+import time
+
+import httpx
+
+from tools.config import env_number
+
+# Statuses that signal overload or a transient server failure
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Statuses that mean the host wants us to slow down
+_THROTTLE_STATUSES = {429, 503}
+
+
+class TokenBucket:
+    """Token bucket whose rate adapts to throttling signals.
+
+    Reservations are computed under a thread lock and waited on with
+    `asyncio.sleep`, so one bucket can be shared across threads and event
+    loops.
+    """
+
+    def __init__(self, rate: float, burst: int, min_rate: Optional[float] = None):
+        """
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum number of tokens that can accumulate
+            min_rate: Floor for the adapted rate (default a tenth of `rate`)
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate or rate / 10
+        self.burst = burst
+        self._tokens = float(burst)
+        # Time tokens were last counted; set in the future while paused
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            return max(0.0, self._updated - now) + max(0.0, -self._tokens / self.rate)
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update (none during a pause)."""
+        if now > self._updated:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def throttled(self, pause: float) -> None:
+        """Halve the rate and hold back every request for `pause` seconds.
+
+        The bucket restarts empty at the end of the pause, so requests that
+        queue up during it are spread out at the new rate afterwards instead
+        of all firing the moment it ends.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            # Waiting requests are already owed tokens; they queue after the pause
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + pause)
+
+    def succeeded(self) -> None:
+        """Recover a tenth of the configured rate after a successful request."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_host_limits: Dict[str, Dict] = {}
+_buckets_lock = threading.Lock()
+
+
+def configure_host(host: str, rate: float, burst: int = 1) -> None:
+    """
+    Set the rate limit for one host (replaces any existing bucket).
+
+    Args:
+        host: Host name, e.g. "www.indeed.com"
+        rate: Requests per second
+        burst: Maximum burst size
+    """
+    with _buckets_lock:
+        _host_limits[host] = {"rate": rate, "burst": burst}
+        _buckets.pop(host, None)
+
+
+def get_rate_limiter(host: str) -> TokenBucket:
+    """Return the shared token bucket for a host."""
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            limits = _host_limits.get(host) or {
+                "rate": env_number("JOBCONNECT_RATE_LIMIT_PER_SEC", 1.0),
+                "burst": int(env_number("JOBCONNECT_RATE_LIMIT_BURST", 3)),
+            }
+            bucket = TokenBucket(limits["rate"], limits["burst"])
+            _buckets[host] = bucket
+        return bucket
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """Exponential backoff with full jitter for the given (0-based) retry attempt."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a `Retry-After` header given in seconds or as an HTTP date."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+async def request_with_retries(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    max_retries: int = 3,
+    **kwargs
+) -> httpx.Response:
+    """
+    Send a rate-limited request, retrying throttled and failed attempts.
+
+    Args:
+        client: HTTP client to send the request with
+        method: HTTP method
+        url: Request URL (its host selects the rate limiter)
+        max_retries: Retries after the first attempt
+        **kwargs: Passed through to `client.request`
+
+    Returns:
+        The final response; after the last retry this may still be a 429/5xx
+
+    Raises:
+        httpx.TransportError: If the last attempt failed to connect
+    """
+    bucket = get_rate_limiter(httpx.URL(url).host)
+    for attempt in range(max_retries + 1):
+        await bucket.acquire()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            if attempt == max_retries:
+                raise
+            delay = backoff_delay(attempt)
+            print(f"Request to {url} failed ({e}); retrying in {delay:.1f}s")
+        else:
+            if response.status_code not in RETRY_STATUSES:
+                bucket.succeeded()
+                return response
+            if attempt == max_retries:
+                return response
+            delay = max(retry_after_seconds(response) or 0.0, backoff_delay(attempt))
+            if response.status_code in _THROTTLE_STATUSES:
+                bucket.throttled(delay)
+            print(f"{response.status_code} from {url}; retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
@@ -0,0 +1,142 @@
+"""Small persistent key-value store on SQLite.
+
+Values are stored as JSON, each table of the database file is a separate
+store, and entries expire after a TTL. The store keeps at most
+`max_entries` entries per table by evicting the least recently used ones,
+so caches built on it (scores, parsed resumes) stay bounded across
+sessions. The database runs in WAL mode so several processes can share a
+file.
+"""
+from typing import Any, Dict, Iterable, Mapping, Optional
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+_TABLE_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# SQLite limits the number of parameters per statement
+_MAX_PARAMS = 500
+
+
+def default_cache_path(filename: str) -> str:
+    """Path of a file in the JobConnect cache folder (~/.cache/jobconnect)."""
+    return os.path.join(os.path.expanduser("~"), ".cache", "jobconnect", filename)
+
+
+class SQLiteStore:
+    """JSON key-value store with TTL and LRU size eviction."""
+
+    def __init__(
+        self,
+        path: str,
+        table: str = "entries",
+        ttl: Optional[float] = None,
+        max_entries: int = 10000
+    ):
+        """
+        Args:
+            path: Database file (":memory:" for a throwaway store)
+            table: Table holding this store's entries
+            ttl: Seconds an entry stays valid (None to never expire)
+            max_entries: Entries kept before the least recently used are evicted
+        """
+        if not _TABLE_NAME_RE.match(table):
+            raise ValueError(f"Invalid table name: {table!r}")
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.table = table
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            if path != ":memory:":
+                self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute(f"CREATE INDEX IF NOT EXISTS {table}_accessed ON {table} (accessed)")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value stored for a key, or None if missing or expired."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return the stored values for the keys that have a valid entry."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Any] = {}
+        now = time.time()
+        oldest = now - self.ttl if self.ttl is not None else float("-inf")
+        with self._lock:
+            for start in range(0, len(keys), _MAX_PARAMS):
+                chunk = keys[start:start + _MAX_PARAMS]
+                marks = ",".join("?" * len(chunk))
+                rows = self._db.execute(
+                    f"SELECT key, value FROM {self.table} WHERE key IN ({marks}) AND created >= ?",
+                    (*chunk, oldest),
+                ).fetchall()
+                for key, value in rows:
+                    try:
+                        found[key] = json.loads(value)
+                    except ValueError:
+                        continue
+                if rows:
+                    self._db.execute(
+                        f"UPDATE {self.table} SET accessed = ? WHERE key IN ({','.join('?' * len(rows))})",
+                        (now, *(key for key, _ in rows)),
+                    )
+        return found
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value."""
+        self.set_many({key: value})
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        """Store several values at once, then evict beyond the size limit."""
+        if not items:
+            return
+        now = time.time()
+        rows = [(key, json.dumps(value), now, now) for key, value in items.items()]
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                self._evict(now)
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if it exists."""
+        with self._lock:
+            self._db.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries and the least recently used ones beyond the limit (lock held)."""
+        if self.ttl is not None:
+            self._db.execute(f"DELETE FROM {self.table} WHERE created < ?", (now - self.ttl,))
+        excess = self._db.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0] - self.max_entries
+        if excess > 0:
+            self._db.execute(
+                f"DELETE FROM {self.table} WHERE key IN "
+                f"(SELECT key FROM {self.table} ORDER BY accessed LIMIT ?)",
+                (excess,),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
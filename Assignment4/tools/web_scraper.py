@@ -1,8 +1,67 @@
-"""General web scraper for job boards using requests and BeautifulSoup."""
-from typing import Dict, List
-import requests
-from bs4 import BeautifulSoup
-import json
+"""General web scraper for job boards using httpx and lxml."""
+from typing import AsyncIterator, Callable, Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import os
+from urllib.parse import urljoin
+import httpx
+import lxml.html
+from lxml import etree
+
+from tools.http_cache import get_http_cache
+from tools.http_client import get_http_client, loop_local
+from tools.rate_limiter import request_with_retries
+
+# Seconds allowed for searching a single job board (all pages)
+BOARD_TIMEOUT = 30.0
+
+# Seconds allowed for fetching a single result page
+PAGE_TIMEOUT = 10.0
+
+# Crawl budget per board
+MAX_PAGES = 3
+MAX_RESULTS_PER_BOARD = 50
+
+# Maximum number of board requests in flight across all searches
+MAX_CONCURRENT_REQUESTS = 4
+
+# Pages at least this many characters are parsed in a separate process
+PROCESS_POOL_THRESHOLD = 512 * 1024
+PARSER_PROCESSES = max(1, min(4, (os.cpu_count() or 1) - 1))
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _request_limit() -> asyncio.Semaphore:
+    """Return the request limiter shared by all searches on the running event loop."""
+    return loop_local("web_scraper.request_limit", lambda: asyncio.Semaphore(MAX_CONCURRENT_REQUESTS))
+
+
+def _default_job_boards() -> List[Dict]:
+    """Return the job boards searched by default.
+
+    `page_param` is the query parameter selecting a result page; page N is
+    requested with `page_start + N * page_step`.
+    """
+    return [
+        {
+            "name": "Indeed",
+            "url": "https://www.indeed.com/jobs",
+            "parser": parse_indeed_jobs,
+            "page_param": "start",
+            "page_start": 0,
+            "page_step": 10
+        },
+        {
+            "name": "Glassdoor",
+            "url": "https://www.glassdoor.com/Job/jobs.htm",
+            "parser": parse_glassdoor_jobs,
+            "page_param": "p",
+            "page_start": 1,
+            "page_step": 1
+        }
+        # Add more job boards as needed
+    ]
 
 async def search_job_boards(search_criteria: Dict) -> List[Dict]:
     """
@@ -16,97 +75,334 @@ async def search_job_boards(search_criteria: Dict) -> List[Dict]:
             - job_type: Full-time, Part-time, etc.
     
     Returns:
-        List of job postings with details
+        List of job postings with a `summary`; full descriptions are fetched
+        lazily from `description_url`
     """
-    # List of job boards to search
-    job_boards = [
-        {
-            "name": "Indeed",
-            "url": "https://www.indeed.com/jobs",
-            "parser": parse_indeed_jobs
-        },
-        {
-            "name": "Glassdoor",
-            "url": "https://www.glassdoor.com/Job/jobs.htm",
-            "parser": parse_glassdoor_jobs
-        }
-        # Add more job boards as needed
-    ]
+    job_boards = _default_job_boards()
+    
+    # Search all job boards concurrently; each board gets its own deadline
+    results = await asyncio.gather(
+        *(
+            asyncio.wait_for(search_job_board(board, search_criteria), BOARD_TIMEOUT)
+            for board in job_boards
+        ),
+        return_exceptions=True
+    )
     
     all_jobs = []
+    for board, result in zip(job_boards, results):
+        if isinstance(result, asyncio.TimeoutError):
+            print(f"Timed out searching {board['name']}")
+        elif isinstance(result, Exception):
+            print(f"Error searching {board['name']}: {result}")
+        else:
+            all_jobs.extend(result)
+    
+    return all_jobs
+
+async def stream_job_boards(
+    search_criteria: Dict,
+    max_pages: int = MAX_PAGES,
+    max_results: int = MAX_RESULTS_PER_BOARD,
+    is_relevant: Optional[Callable[[Dict], bool]] = None
+) -> AsyncIterator[Dict]:
+    """
+    Crawl all job boards concurrently and yield jobs as soon as they are parsed.
     
-    # Search each job board
-    for board in job_boards:
+    Unlike `search_job_boards`, consumers can start working on the first jobs
+    while later pages are still being fetched. A board that exceeds
+    `BOARD_TIMEOUT` stops contributing, but jobs it already produced are kept.
+    
+    Args:
+        search_criteria: Search parameters (see `search_job_boards`)
+        max_pages: Maximum number of result pages per board
+        max_results: Stop a board after this many relevant jobs
+        is_relevant: Optional predicate; only matching jobs are yielded and
+            counted against `max_results`
+    
+    Yields:
+        Job postings from all boards, in arrival order
+    """
+    job_boards = _default_job_boards()
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+
+    async def crawl(board: Dict):
+        async for job in crawl_job_board(board, search_criteria, max_pages, max_results, is_relevant):
+            await queue.put(job)
+
+    async def produce(board: Dict):
         try:
-            jobs = await search_job_board(board, search_criteria)
-            all_jobs.extend(jobs)
+            await asyncio.wait_for(crawl(board), BOARD_TIMEOUT)
+        except asyncio.TimeoutError:
+            print(f"Timed out searching {board['name']}")
         except Exception as e:
             print(f"Error searching {board['name']}: {e}")
+        finally:
+            await queue.put(done)
+
+    producers = [asyncio.ensure_future(produce(board)) for board in job_boards]
+    try:
+        remaining = len(producers)
+        while remaining:
+            item = await queue.get()
+            if item is done:
+                remaining -= 1
+            else:
+                yield item
+    finally:
+        for producer in producers:
+            producer.cancel()
+
+async def search_job_board(
+    board: Dict,
+    search_criteria: Dict,
+    client: Optional[httpx.AsyncClient] = None
+) -> List[Dict]:
+    """Search a specific job board, following result pages up to the crawl budget."""
+    return [job async for job in crawl_job_board(board, search_criteria, client=client)]
+
+async def crawl_job_board(
+    board: Dict,
+    search_criteria: Dict,
+    max_pages: int = MAX_PAGES,
+    max_results: int = MAX_RESULTS_PER_BOARD,
+    is_relevant: Optional[Callable[[Dict], bool]] = None,
+    client: Optional[httpx.AsyncClient] = None
+) -> AsyncIterator[Dict]:
+    """
+    Yield jobs from successive result pages of one job board.
     
-    return all_jobs
+    The request for page N+1 is already in flight while page N is parsed,
+    so network time and parsing overlap. Crawling stops after `max_pages`,
+    once `max_results` relevant jobs were yielded, or when a page brings no
+    new jobs.
+    
+    Args:
+        board: Job board config (see `_default_job_boards`)
+        search_criteria: Search parameters (see `search_job_boards`)
+        max_pages: Maximum number of result pages to fetch
+        max_results: Stop after this many relevant jobs
+        is_relevant: Optional predicate; only matching jobs are yielded
+        client: HTTP client to use instead of the shared pool
+    
+    Yields:
+        Parsed job postings
+    """
+    seen_ids = set()
+    found = 0
+    next_page = asyncio.ensure_future(_fetch_page(board, search_criteria, 0, client))
+    try:
+        for page in range(max_pages):
+            html = await next_page
+            next_page = None
+            if html is None:
+                return
+            
+            # Start fetching the next page before parsing this one
+            if page + 1 < max_pages:
+                next_page = asyncio.ensure_future(_fetch_page(board, search_criteria, page + 1, client))
+            
+            new_jobs = 0
+            for job in await board["parser"](html):
+                if job["id"] and job["id"] in seen_ids:
+                    continue
+                seen_ids.add(job["id"])
+                new_jobs += 1
+                if is_relevant and not is_relevant(job):
+                    continue
+                yield job
+                found += 1
+                if found >= max_results:
+                    return
+            
+            if not new_jobs:
+                # Past the last page: boards repeat or return nothing
+                return
+    finally:
+        if next_page is not None:
+            if next_page.done() and not next_page.cancelled():
+                # Retrieve the result so a failed prefetch is not reported as unhandled
+                next_page.exception()
+            else:
+                next_page.cancel()
+
+async def _fetch_page(
+    board: Dict,
+    search_criteria: Dict,
+    page: int,
+    client: Optional[httpx.AsyncClient] = None
+) -> Optional[str]:
+    """Fetch one result page of a job board; returns None on a non-200 response.
 
-async def search_job_board(board: Dict, search_criteria: Dict) -> List[Dict]:
-    """Search a specific job board."""
+    Pages are served from the on-disk HTTP cache while fresh and revalidated
+    with a conditional request once stale.
+    """
     # Construct search URL with parameters
     params = {
         "q": " ".join(search_criteria.get("keywords", [])),
         "l": search_criteria.get("location", ""),
         # Add other parameters based on the job board
     }
+    params[board["page_param"]] = board["page_start"] + page * board["page_step"]
     
-    # Make request
-    headers = {
-        "User-Agent": "Mozilla/5.0 (compatible; JobSearchBot/1.0)"
-    }
-    response = requests.get(board["url"], params=params, headers=headers)
+    cache = get_http_cache()
+    key = cache.key(board["url"], params)
+    cached = await asyncio.to_thread(cache.lookup, key)
+    if cached and cache.is_fresh(cached):
+        return cached["body"]
+    
+    # Make request on the shared connection pool unless a client is given;
+    # the per-host rate limiter and retries are shared by all searches
+    client = client or get_http_client()
+    async with _request_limit():
+        response = await request_with_retries(
+            client,
+            "GET",
+            board["url"],
+            params=params,
+            headers=cache.conditional_headers(cached),
+            timeout=PAGE_TIMEOUT
+        )
     
-    if response.status_code == 200:
-        # Parse response using board-specific parser
-        return await board["parser"](response.text)
+    if response.status_code == 304 and cached:
+        await asyncio.to_thread(cache.refresh, key, cached, response.headers)
+        return cached["body"]
+    elif response.status_code == 200:
+        await asyncio.to_thread(cache.store, key, board["url"], response.headers, response.text)
+        return response.text
     else:
-        print(f"Error {response.status_code} from {board['name']}")
-        return []
+        print(f"Error {response.status_code} from {board['name']} (page {page + 1})")
+        return None
 
 async def parse_indeed_jobs(html: str) -> List[Dict]:
-    """Parse Indeed job listings."""
-    soup = BeautifulSoup(html, 'html.parser')
-    jobs = []
-    
-    # Find all job cards
-    for card in soup.find_all("div", class_="job_seen_beacon"):
-        try:
-            job = {
-                "id": card.get("data-jk", ""),
-                "title": card.find("h2", class_="jobTitle").text.strip(),
-                "company": card.find("span", class_="companyName").text.strip(),
-                "location": card.find("div", class_="companyLocation").text.strip(),
-                "description": card.find("div", class_="job-snippet").text.strip(),
-                "source": "Indeed"
-            }
-            jobs.append(job)
-        except Exception as e:
-            print(f"Error parsing Indeed job: {e}")
-    
-    return jobs
+    """Parse Indeed job listings off the event loop."""
+    return await _parse_off_loop(extract_indeed_jobs, html)
 
 async def parse_glassdoor_jobs(html: str) -> List[Dict]:
-    """Parse Glassdoor job listings."""
-    soup = BeautifulSoup(html, 'html.parser')
+    """Parse Glassdoor job listings off the event loop."""
+    return await _parse_off_loop(extract_glassdoor_jobs, html)
+
+async def _parse_off_loop(extractor: Callable[[str], List[Dict]], html: str) -> List[Dict]:
+    """Run a CPU-bound extractor in a worker so fetches keep flowing.
+
+    Typical pages go to the default thread pool (lxml releases the GIL while
+    building the tree); pages above `PROCESS_POOL_THRESHOLD` bytes go to a
+    process pool so they cannot starve the interpreter.
+    """
+    loop = asyncio.get_running_loop()
+    if len(html) >= PROCESS_POOL_THRESHOLD:
+        return await loop.run_in_executor(_get_process_pool(), extractor, html)
+    return await loop.run_in_executor(None, extractor, html)
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool for parsing large pages."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=PARSER_PROCESSES)
+    return _process_pool
+
+def _class_xpath(tag: str, class_name: str) -> str:
+    """XPath matching descendants `tag` that carry `class_name` among their classes."""
+    return f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+def _card_text(card, xpath: etree.XPath, field: str) -> str:
+    """Return the stripped text of the first element matched inside a card."""
+    matches = xpath(card)
+    if not matches:
+        raise ValueError(f"missing {field}")
+    return matches[0].text_content().strip()
+
+_INDEED_CARDS = etree.XPath(_class_xpath("div", "job_seen_beacon"))
+_INDEED_FIELDS = {
+    "title": etree.XPath(_class_xpath("h2", "jobTitle")),
+    "company": etree.XPath(_class_xpath("span", "companyName")),
+    "location": etree.XPath(_class_xpath("div", "companyLocation")),
+    "summary": etree.XPath(_class_xpath("div", "job-snippet")),
+}
+
+_GLASSDOOR_CARDS = etree.XPath(_class_xpath("li", "react-job-listing"))
+_GLASSDOOR_FIELDS = {
+    "title": etree.XPath(_class_xpath("a", "jobLink")),
+    "company": etree.XPath(_class_xpath("div", "jobHeader")),
+    "location": etree.XPath(_class_xpath("span", "loc")),
+    "summary": etree.XPath(_class_xpath("div", "jobDescriptionContent")),
+}
+
+# Description containers on the job detail pages, most specific first
+_DESCRIPTION_XPATHS = {
+    "Indeed": [etree.XPath(".//div[@id='jobDescriptionText']")],
+    "Glassdoor": [
+        etree.XPath(_class_xpath("div", "jobDescriptionContent")),
+        etree.XPath(".//div[contains(@class, 'JobDetails_jobDescription')]"),
+    ],
+}
+
+def _indeed_detail_url(card, job: Dict) -> Optional[str]:
+    return f"https://www.indeed.com/viewjob?jk={job['id']}" if job["id"] else None
+
+def _glassdoor_detail_url(card, job: Dict) -> Optional[str]:
+    links = _GLASSDOOR_FIELDS["title"](card)
+    href = links[0].get("href") if links else None
+    return urljoin("https://www.glassdoor.com/", href) if href else None
+
+def _extract_cards(
+    html: str,
+    cards: etree.XPath,
+    fields: Dict,
+    id_attr: str,
+    source: str,
+    detail_url: Callable
+) -> List[Dict]:
+    """Extract one job per card using precompiled XPath selectors.
+
+    Cards only carry a snippet, kept as `summary`; the full `description` is
+    left unset and fetched from `description_url` when someone needs it
+    (see `tools.job_search.descriptions`).
+    """
+    if not html.strip():
+        return []
+    root = lxml.html.fromstring(html)
     jobs = []
     
     # Find all job cards
-    for card in soup.find_all("li", class_="react-job-listing"):
+    for card in cards(root):
         try:
-            job = {
-                "id": card.get("data-id", ""),
-                "title": card.find("a", class_="jobLink").text.strip(),
-                "company": card.find("div", class_="jobHeader").text.strip(),
-                "location": card.find("span", class_="loc").text.strip(),
-                "description": card.find("div", class_="jobDescriptionContent").text.strip(),
-                "source": "Glassdoor"
-            }
+            job = {"id": card.get(id_attr, "")}
+            for field, xpath in fields.items():
+                job[field] = _card_text(card, xpath, field)
+            job["description"] = None
+            job["description_url"] = detail_url(card, job)
+            job["source"] = source
             jobs.append(job)
         except Exception as e:
-            print(f"Error parsing Glassdoor job: {e}")
+            print(f"Error parsing {source} job: {e}")
     
-    return jobs
\ No newline at end of file
+    return jobs
+
+def extract_indeed_jobs(html: str) -> List[Dict]:
+    """Extract Indeed job listings from a result page (blocking)."""
+    return _extract_cards(html, _INDEED_CARDS, _INDEED_FIELDS, "data-jk", "Indeed", _indeed_detail_url)
+
+def extract_glassdoor_jobs(html: str) -> List[Dict]:
+    """Extract Glassdoor job listings from a result page (blocking)."""
+    return _extract_cards(html, _GLASSDOOR_CARDS, _GLASSDOOR_FIELDS, "data-id", "Glassdoor", _glassdoor_detail_url)
+
+def extract_board_description(html: str, source: str) -> str:
+    """Extract the description text from a job board detail page (blocking)."""
+    if not html.strip():
+        return ""
+    root = lxml.html.fromstring(html)
+    for xpath in _DESCRIPTION_XPATHS.get(source, []):
+        matches = xpath(root)
+        if matches:
+            return matches[0].text_content().strip()
+    return ""
+
+async def fetch_board_description(url: str, source: str) -> str:
+    """Fetch a job board detail page on the shared HTTP client and extract its description."""
+    response = await request_with_retries(get_http_client(), "GET", url, timeout=PAGE_TIMEOUT)
+    if response.status_code != 200:
+        print(f"Error {response.status_code} getting job description from {url}")
+        return ""
+    return await asyncio.to_thread(extract_board_description, response.text, source)
@@ -0,0 +1,224 @@
+"""Pool of warm, headless Chrome WebDriver instances for the scrapers.
+
+Starting Chrome takes seconds, so drivers are kept alive between searches
+and leased out with `async with pool.lease() as driver:`. A driver is
+health-checked before each lease and recycled after `max_uses` leases or
+when its browser session is lost. Page-level errors raised inside a lease
+(a `WebDriverWait` timeout, a missing element) propagate to the caller but
+leave the driver in the pool as long as its session still responds.
+
+Settings come from environment variables (or `.env`):
+
+    JOBCONNECT_WEBDRIVER_POOL_SIZE  maximum number of browsers (default 2)
+    JOBCONNECT_WEBDRIVER_MAX_USES   leases before a browser is replaced (default 20)
+"""
+from typing import AsyncIterator, Callable, List, Optional
+from contextlib import asynccontextmanager
+import asyncio
+import atexit
+import threading
+
+from selenium import webdriver
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchWindowException,
+    WebDriverException,
+)
+from urllib3.exceptions import HTTPError as DriverConnectionError
+
+from tools.config import env_number
+
+# Seconds between checks for a free driver while the pool is exhausted
+LEASE_POLL_INTERVAL = 0.05
+
+# Errors that mean the browser session itself is gone, not just the page
+_SESSION_ERRORS = (InvalidSessionIdException, NoSuchWindowException, ConnectionError, DriverConnectionError)
+
+
+def create_headless_chrome() -> webdriver.Chrome:
+    """Start a headless Chrome suitable for scraping."""
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1366,900")
+    return webdriver.Chrome(options=options)
+
+
+class _PooledDriver:
+    """A driver together with its lease count."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+
+
+class WebDriverPool:
+    """Bounded pool of reusable WebDriver instances.
+
+    Slots are tracked with a thread semaphore rather than asyncio
+    primitives, so the pool can be shared by several event loops and threads.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_uses: int = 20,
+        factory: Callable[[], webdriver.Remote] = create_headless_chrome
+    ):
+        """
+        Args:
+            size: Maximum number of drivers alive at once
+            max_uses: Leases after which a driver is quit and replaced
+            factory: Creates a new driver
+        """
+        self.size = size
+        self.max_uses = max_uses
+        self._factory = factory
+        self._idle: List[_PooledDriver] = []
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def warm(self, count: Optional[int] = None) -> None:
+        """Start drivers ahead of time so the first searches skip browser boot."""
+        count = min(self.size, count or self.size)
+        with self._lock:
+            missing = count - len(self._idle)
+        for _ in range(max(0, missing)):
+            self._slots.acquire()
+            try:
+                entry = _PooledDriver(self._factory())
+            except BaseException:
+                self._slots.release()
+                raise
+            self._release_blocking(entry, broken=False, counts=False)
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[webdriver.Remote]:
+        """Lease a healthy driver for the duration of the `async with` block."""
+        if self._closed:
+            raise RuntimeError("WebDriver pool is closed")
+
+        # Wait for a free slot on the event loop rather than parking a worker
+        # thread on the semaphore; releases need those threads.
+        while not self._slots.acquire(blocking=False):
+            await asyncio.sleep(LEASE_POLL_INTERVAL)
+
+        loop = asyncio.get_running_loop()
+        checkout = loop.run_in_executor(None, self._checkout)
+        try:
+            entry = await asyncio.shield(checkout)
+        except asyncio.CancelledError:
+            # The worker thread carries on; return its driver when it is done
+            checkout.add_done_callback(self._give_back)
+            raise
+        except BaseException:
+            self._slots.release()
+            raise
+
+        broken = False
+        check = False
+        try:
+            yield entry.driver
+        except _SESSION_ERRORS:
+            broken = True
+            raise
+        except WebDriverException:
+            # Timeouts and missing elements leave the browser usable; only
+            # recycle it if the session no longer responds
+            check = True
+            raise
+        finally:
+            await loop.run_in_executor(None, self._release_blocking, entry, broken, True, check)
+
+    def _checkout(self) -> _PooledDriver:
+        """Return a healthy idle driver, or start a new one (caller holds a slot)."""
+        while True:
+            with self._lock:
+                entry = self._idle.pop() if self._idle else None
+            if entry is None:
+                return _PooledDriver(self._factory())
+            if self._is_healthy(entry):
+                return entry
+            self._quit(entry)
+
+    def _give_back(self, checkout: asyncio.Future) -> None:
+        """Release the slot (and driver) of a checkout whose lease was cancelled."""
+        if checkout.cancelled() or checkout.exception() is not None:
+            self._slots.release()
+        else:
+            self._release_blocking(checkout.result(), broken=False, counts=False)
+
+    def _release_blocking(
+        self,
+        entry: _PooledDriver,
+        broken: bool,
+        counts: bool = True,
+        check: bool = False
+    ) -> None:
+        """Return a driver to the pool, or quit it if it is worn out or broken.
+
+        With `check` the driver is health-checked first and quit if its
+        session no longer responds.
+        """
+        try:
+            if counts:
+                entry.uses += 1
+            if check and not broken:
+                broken = not self._is_healthy(entry)
+            if broken or self._closed or entry.uses >= self.max_uses:
+                self._quit(entry)
+                return
+            try:
+                # Don't leak one search's session into the next
+                entry.driver.delete_all_cookies()
+            except WebDriverException:
+                self._quit(entry)
+                return
+            with self._lock:
+                self._idle.append(entry)
+        finally:
+            self._slots.release()
+
+    @staticmethod
+    def _is_healthy(entry: _PooledDriver) -> bool:
+        """Check that the browser session still responds."""
+        try:
+            entry.driver.current_url
+            return True
+        except (WebDriverException, *_SESSION_ERRORS):
+            return False
+
+    @staticmethod
+    def _quit(entry: _PooledDriver) -> None:
+        try:
+            entry.driver.quit()
+        except Exception as e:
+            print(f"Error closing WebDriver: {e}")
+
+    def close(self) -> None:
+        """Quit all idle drivers; leased drivers are quit when returned."""
+        self._closed = True
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for entry in idle:
+            self._quit(entry)
+
+
+_pool: Optional[WebDriverPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_webdriver_pool() -> WebDriverPool:
+    """Return the process-wide WebDriver pool configured from the environment."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = WebDriverPool(
+                size=int(env_number("JOBCONNECT_WEBDRIVER_POOL_SIZE", 2)),
+                max_uses=int(env_number("JOBCONNECT_WEBDRIVER_MAX_USES", 20)),
+            )
+            atexit.register(_pool.close)
+        return _pool